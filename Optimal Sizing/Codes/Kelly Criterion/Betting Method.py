@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 def load_pnls(file_path):
     trades = pd.read_csv(file_path)
@@ -26,6 +25,7 @@ def kelly(p, q, b, a_values):
     return [(p / a - q / b) if a > 0 else np.nan for a in a_values]
 
 def plot_kelly(a_values, f_values):
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(14,7))
     plt.plot(a_values, f_values, label="Kelly Curve", color='blue')
     plt.title('Kelly Curve: f vs a')
@@ -45,4 +45,5 @@ def analyze(file_path):
     f_values = kelly(p, q, b, a_values)
     plot_kelly(a_values, f_values)
 
-analyze('Trades.csv')
+if __name__ == "__main__":
+    analyze('Trades.csv')
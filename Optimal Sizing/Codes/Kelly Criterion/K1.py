@@ -1,6 +1,12 @@
+import os
+import sys
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sizing import plots
+from sizing.kelly import growth_optimal_fraction, terminal_wealth, win_loss_payoffs
+from sizing.kernels import win_loss_finals
 
 def load_pnls(file_path):
     trades = pd.read_csv(file_path)
@@ -13,40 +19,37 @@ def win_loss_ratio(pnl_values):
     losses = pnl_values[pnl_values < 0]
     return np.inf if len(losses) == 0 else np.mean(wins) / np.abs(np.mean(losses))
 
-def simulate(pnl_values, risk_percentage, wl_ratio, num_trades=59):
-    portfolio_value = 1
-    for i in range(num_trades):
-        pnl = pnl_values[i]
-        portfolio_value *= (1 + risk_percentage * wl_ratio) if pnl > 0 else (1 - risk_percentage)
-    return portfolio_value
+def simulate(pnl_values, risk_percentage, wl_ratio, num_trades=59, backend="auto"):
+    return simulate_risks(pnl_values, [risk_percentage], wl_ratio, num_trades, backend)[0]
+
+def simulate_risks(pnl_values, risks, wl_ratio, num_trades=59, backend="auto"):
+    # Final portfolio value for every risk level over the first num_trades
+    # trades. The replay is deterministic, so one run per risk is enough.
+    wins = pnl_values[:num_trades] > 0
+    return win_loss_finals(wins, risks, wl_ratio, backend)[:, 0]
+
+def wealth_curve(pnl_values, risks, wl_ratio, num_trades=59):
+    # simulate_risks as one log-sum over the win/loss counts
+    payoffs = win_loss_payoffs(pnl_values[:num_trades] > 0, wl_ratio)
+    return terminal_wealth(payoffs, risks)
 
 def plot_curve(pnl_values, wl_ratio, max_risk=1, num_simulations=100):
     risks = np.linspace(0.01, max_risk, num_simulations)
-    final_returns = []
-    for risk in risks:
-        final_portfolio_values = [simulate(pnl_values, risk, wl_ratio) for _ in range(100)]
-        final_returns.append(np.mean(final_portfolio_values))
-    
-    plt.figure(figsize=(14,7))
-    plt.plot(risks, final_returns, label="Final Cumulative Return", color='blue')
-    plt.title('Final Cumulative Return vs Risk Percentage per Trade')
-    plt.xlabel('Risk Percentage per Trade')
-    plt.ylabel('Average Final Portfolio Value')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    final_returns = wealth_curve(pnl_values, risks, wl_ratio).tolist()
+
+    plots.kelly_curve_figure(risks, final_returns, 'Final Cumulative Return vs Risk Percentage per Trade', 'Risk Percentage per Trade', 'Average Final Portfolio Value')
+    plots.show()
 
-def kelly(pnl_values, wl_ratio, max_risk=1, num_simulations=100):
+def kelly(pnl_values, wl_ratio, max_risk=1, num_simulations=100, num_trades=59):
+    # The growth-optimal risk is solved for directly; the grid only samples
+    # the curve for plotting.
     risks = np.linspace(0.01, max_risk, num_simulations)
-    final_returns = []
-    for risk in risks:
-        final_portfolio_values = [simulate(pnl_values, risk, wl_ratio) for _ in range(100)]
-        final_returns.append(np.mean(final_portfolio_values))
+    final_returns = wealth_curve(pnl_values, risks, wl_ratio, num_trades).tolist()
     
-    max_y_value = max(final_returns)
-    max_x_value = risks[np.argmax(final_returns)]
+    payoffs = win_loss_payoffs(pnl_values[:num_trades] > 0, wl_ratio)
+    optimal_risk = growth_optimal_fraction(payoffs, max_risk)
     
-    return max_x_value, final_returns, risks
+    return optimal_risk, final_returns, risks
 
 def analyze(file_path):
     pnl_values = load_pnls(file_path)
@@ -55,13 +58,8 @@ def analyze(file_path):
     
     print(f"The Kelly Criterion (optimal risk per trade) is: {optimal_risk:.4f}")
     
-    plt.figure(figsize=(14,7))
-    plt.plot(risks, final_returns, label="Final Cumulative Return", color='blue')
-    plt.title('Final Cumulative Return vs Risk per Trade')
-    plt.xlabel('Risk per Trade')
-    plt.ylabel('Average Final Cumulative Return')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    plots.kelly_curve_figure(risks, final_returns, 'Final Cumulative Return vs Risk per Trade', 'Risk per Trade', 'Average Final Cumulative Return')
+    plots.show()
 
-analyze('Trades.csv')
+if __name__ == "__main__":
+    analyze('Trades.csv')
@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 def load_pnls(file_path):
     trades = pd.read_csv(file_path)
@@ -26,6 +25,8 @@ def analyze(file_path, rf_rate):
     print(f"Standard Deviation (σ): {sigma:.4f}")
     print(f"Risk-Free Rate (r): {rf_rate:.4f}")
     print(f"Optimal Kelly Criterion (f): {kelly_fraction:.4f}")
+
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(14,7))
     plt.hist(pnl_values, bins=30, color='blue', alpha=0.7, label='PnL Distribution')
     plt.axvline(mu, color='red', linestyle='--', label='Mean PnL (µ)')
@@ -38,4 +39,5 @@ def analyze(file_path, rf_rate):
     plt.grid(True)
     plt.show()
 
-analyze('Trades.csv', rf_rate=0)
+if __name__ == "__main__":
+    analyze('Trades.csv', rf_rate=0)
@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 def load_pnls(file_path):
     trades = pd.read_csv(file_path)
@@ -29,6 +28,7 @@ def sortino_ratio(pnl_values, rf_rate=0.0):
     return np.mean(excess_returns) / downside_deviation
 
 def plot_curve(cum_returns):
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(14,7))
     plt.plot(cum_returns, color='blue', linewidth=1)
     plt.title('Portfolio Equity Curve')
@@ -50,4 +50,5 @@ def analyze(file_path, rf_rate=0.0):
     print(f"Sharpe Ratio: {sharpe:.4f}")
     print(f"Sortino Ratio: {sortino:.4f}")
 
-analyze('Trades.csv')
+if __name__ == "__main__":
+    analyze('Trades.csv')
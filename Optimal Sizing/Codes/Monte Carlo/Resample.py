@@ -1,6 +1,12 @@
+import os
+import sys
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sizing.bootstrap import permute
+from sizing import plots
+from sizing.sketch import percentiles, sketch_simulations
 
 def load_pnls(file_path):
     trades = pd.read_csv(file_path)
@@ -24,49 +30,52 @@ def sortino_ratio(pnl_values, rf_rate=0.0):
     downside_deviation = np.std(excess_returns[excess_returns < 0])
     return np.mean(excess_returns) / downside_deviation
 
-def run_simulations(pnl_values, num_simulations=1000):
-    metrics = {'max_drawdowns': [], 'sharpe_ratios': [], 'sortino_ratios': []}
-    for _ in range(num_simulations):
-        shuffled_pnl = np.random.permutation(pnl_values)
-        cumulative_returns = cum_returns(shuffled_pnl)
-        metrics['max_drawdowns'].append(max_drawdown(cumulative_returns))
-        metrics['sharpe_ratios'].append(sharpe_ratio(shuffled_pnl))
-        metrics['sortino_ratios'].append(sortino_ratio(shuffled_pnl))
-    return metrics
+def run_simulations(pnl_values, num_simulations=1000, rf_rate=0.0, seed=None, workers=1):
+    return permute(pnl_values, num_simulations, rf_rate, seed, workers=workers)
+
+def simulation_metrics(simulations):
+    return {
+        'max_drawdowns': simulations.max_dd,
+        'sharpe_ratios': simulations.sharpe,
+        'sortino_ratios': simulations.sortino,
+    }
 
-def plot_simulations(pnl_values, num_simulations=1000):
-    plt.figure(figsize=(14, 7))
-    for _ in range(num_simulations):
-        shuffled_pnl = np.random.permutation(pnl_values)
-        cumulative_returns = cum_returns(shuffled_pnl)
-        plt.plot(cumulative_returns, color='blue', alpha=0.05)
-    original_cumulative_returns = cum_returns(pnl_values)
-    plt.plot(original_cumulative_returns, color='black', linewidth=1.5, label='Original Equity Curve')
-    plt.title('Monte Carlo Simulation of Cumulative Portfolio Returns (Resampled)')
-    plt.xlabel('Trade Index')
-    plt.ylabel('Cumulative Return')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+def plot_simulations(pnl_values, simulations, mode='auto', density=False):
+    plots.paths_figure(pnl_values, simulations.cum_ret, 'Monte Carlo Simulation of Cumulative Portfolio Returns (Resampled)', mode, density)
+    plots.show()
 
 def print_percentiles(metrics):
     for metric, values in metrics.items():
-        p5, p95 = np.percentile(values, [5, 95])
+        p5, p95 = percentiles(values, [5, 95])
         print(f"5th Percentile of {metric.capitalize()}: {p5:.4f}")
         print(f"95th Percentile of {metric.capitalize()}: {p95:.4f}")
 
-def monte_carlo_simulation(file_path, num_simulations=1000, rf_rate=0.0):
+def stream_simulations(pnl_values, num_simulations=1000000, rf_rate=0.0, seed=None, block_size=16384, workers=1):
+    return sketch_simulations(pnl_values, num_simulations, 'permute', rf_rate, seed, block_size, workers=workers)
+
+def monte_carlo_percentiles(file_path, num_simulations=1000000, rf_rate=0.0, seed=None, workers=1):
+    pnl_values = load_pnls(file_path)
+    sketches = stream_simulations(pnl_values, num_simulations, rf_rate, seed, workers=workers)
+    print_percentiles({
+        'max_drawdowns': sketches['max_dd'],
+        'sharpe_ratios': sketches['sharpe'],
+        'sortino_ratios': sketches['sortino'],
+    })
+
+def monte_carlo_simulation(file_path, num_simulations=1000, rf_rate=0.0, seed=None, workers=1):
     pnl_values = load_pnls(file_path)
-    metrics = run_simulations(pnl_values, num_simulations)
+    simulations = run_simulations(pnl_values, num_simulations, rf_rate, seed, workers)
+    metrics = simulation_metrics(simulations)
     avg_max_dd = np.mean(metrics['max_drawdowns'])
     avg_sharpe = np.mean(metrics['sharpe_ratios'])
     avg_sortino = np.mean(metrics['sortino_ratios'])
     
     print_percentiles(metrics)
-    plot_simulations(pnl_values, num_simulations)
+    plot_simulations(pnl_values, simulations)
     
     print(f"Average Maximum Drawdown: {avg_max_dd:.4f}")
     print(f"Average Sharpe Ratio: {avg_sharpe:.4f}")
     print(f"Average Sortino Ratio: {avg_sortino:.4f}")
 
-monte_carlo_simulation('Trades.csv')
+if __name__ == "__main__":
+    monte_carlo_simulation('Trades.csv')
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The shared omega package (instrumentation, result cache, CLI helpers) sits
+# at the repository root
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import sys
+
+from omega.cli import add_output_args, run
+
+# Headless entry point for batch jobs, run from Optimal Sizing/Codes:
+#   python -m sizing combination --out-dir out --figures
+# Metrics go to <out-dir>/<command>.json and, with --figures, figures to
+# <out-dir>/<command>*.png. numpy/pandas load only once a command runs and
+# matplotlib only with --figures. --trades defaults to the bundled Trades.csv.
+
+TRADES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trades.csv")
+
+def percentile_summary(values):
+    from sizing.sketch import percentiles
+
+    p5, p50, p95 = percentiles(values, [5, 50, 95])
+    return {"p5": float(p5), "median": float(p50), "p95": float(p95)}
+
+def combination(args):
+    from sizing.combination import calc_thorp_kelly, simulate, size_ratios
+
+    amount_risked, median_returns, median_vars, ruin_rates, mu, sigma_sq, avg_loss = simulate(
+        args.trades, args.rf, args.kelly_steps, args.sims, args.size, args.threshold, args.seed, workers=args.workers, use_cache=args.use_cache
+    )
+    opt_kelly_risk = calc_thorp_kelly(mu, sigma_sq, args.rf) * abs(avg_loss) * 100
+    result = {
+        "ratios": size_ratios(args.trades, args.rf, amount_risked, median_returns, median_vars),
+        "amount_risked": amount_risked.tolist(),
+        "median_returns": median_returns,
+        "median_vars": median_vars,
+        "ruin_rates": ruin_rates,
+    }
+    figures = [("combination", lambda plots: plots.sizing_figure(amount_risked, median_returns, median_vars, ruin_rates, args.threshold, opt_kelly_risk))]
+    return result, figures
+
+def monte_carlo(args, method, title):
+    import numpy as np
+
+    from sizing.bootstrap import bootstrap, permute
+    from sizing.combination import load_data
+    from sizing.sketch import percentiles
+
+    pnl = load_data(args.trades)
+    if method == "bootstrap":
+        sims = bootstrap(pnl, args.sims, args.rf, args.seed, workers=args.workers)
+    else:
+        sims = permute(pnl, args.sims, args.rf, args.seed, workers=args.workers)
+    result = {name: percentile_summary(getattr(sims, name)) for name in ("max_dd", "sharpe", "sortino", "final_ret")}
+    figures = [
+        (args.command, lambda plots: plots.paths_figure(pnl, sims.cum_ret, title)),
+        (f"{args.command}_percentiles", lambda plots: plots.percentile_figure(percentiles(sims.final_ret, np.linspace(0, 100, 101)))),
+    ]
+    return {"metrics": result}, figures
+
+def randomize(args):
+    return monte_carlo(args, "bootstrap", "Monte Carlo Simulation of Cumulative Portfolio Returns")
+
+def resample(args):
+    return monte_carlo(args, "permute", "Monte Carlo Simulation of Cumulative Portfolio Returns (Resampled)")
+
+def kelly(args):
+    import numpy as np
+
+    from sizing.combination import load_data
+    from sizing.kelly import growth_optimal_fraction, terminal_wealth, win_loss_payoffs
+
+    pnl = load_data(args.trades)
+    losses = pnl[pnl < 0]
+    wl_ratio = np.inf if len(losses) == 0 else np.mean(pnl[pnl > 0]) / np.abs(np.mean(losses))
+    payoffs = win_loss_payoffs(pnl[:args.size] > 0, wl_ratio)
+    risks = np.linspace(0.01, 1, args.kelly_steps)
+    final_returns = terminal_wealth(payoffs, risks)
+    result = {
+        "optimal_risk": float(growth_optimal_fraction(payoffs)),
+        "win_loss_ratio": float(wl_ratio),
+        "risks": risks.tolist(),
+        "final_returns": final_returns.tolist(),
+    }
+    figures = [("kelly", lambda plots: plots.kelly_curve_figure(risks, final_returns, 'Final Cumulative Return vs Risk per Trade', 'Risk per Trade', 'Average Final Cumulative Return'))]
+    return result, figures
+
+def batch(args):
+    from sizing.batch import kelly_summary
+
+    summary = kelly_summary(args.trades, args.rf)
+    return {"table": json.loads(summary.to_json(orient="records"))}, []
+
+COMMANDS = {"combination": combination, "randomize": randomize, "resample": resample, "kelly": kelly, "batch": batch}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sizing", description="Position sizing simulations and Kelly analytics.")
+    parser.add_argument("command", choices=list(COMMANDS))
+    parser.add_argument("--trades", default=TRADES, help="CSV with a PnL column (batch also takes a folder)")
+    parser.add_argument("--rf", type=float, default=0.0)
+    parser.add_argument("--sims", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=150, help="trades per path (combination) or replayed trades (kelly)")
+    parser.add_argument("--kelly-steps", type=int, default=100)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    add_output_args(parser)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    return run(COMMANDS, parse_args(argv), "sizing.plots")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Kelly analytics for many strategies at once. Trades come either from a
+# directory of per-strategy CSVs (strategy = file name) or from one CSV with
+# a strategy column; every statistic is a grouped np.bincount over the
+# concatenated PnL column.
+
+def load_trade_logs(path, strategy_column="Strategy"):
+    if os.path.isdir(path):
+        frames = []
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".csv"):
+                trades = pd.read_csv(os.path.join(path, name))
+                trades[strategy_column] = os.path.splitext(name)[0]
+                frames.append(trades)
+        if not frames:
+            raise ValueError(f"No CSV files in {path}.")
+        trades = pd.concat(frames, ignore_index=True)
+    else:
+        trades = pd.read_csv(path)
+        if strategy_column not in trades.columns:
+            trades[strategy_column] = os.path.splitext(os.path.basename(path))[0]
+    if 'PnL' not in trades.columns:
+        raise ValueError("The file must contain a 'PnL' column.")
+    return trades
+
+def group_codes(trades, strategy_column="Strategy"):
+    codes, strategies = pd.factorize(trades[strategy_column], sort=True)
+    return codes, np.asarray(strategies), trades['PnL'].to_numpy(dtype=np.float64)
+
+def grouped_mean(codes, values, counts):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.bincount(codes, values, minlength=len(counts)) / counts
+
+def kelly_stats(codes, pnl, n_strategies, rf_rate=0.0, max_risk=1.0):
+    n = np.bincount(codes, minlength=n_strategies).astype(np.float64)
+    win = pnl > 0
+    loss = pnl < 0
+    n_win = np.bincount(codes, win, minlength=n_strategies)
+    n_loss = np.bincount(codes, loss, minlength=n_strategies)
+
+    mu = grouped_mean(codes, pnl, n)
+    # Two-pass variance, matching np.var per strategy
+    sigma_sq = grouped_mean(codes, (pnl - mu[codes]) ** 2, n)
+    avg_win = grouped_mean(codes, np.where(win, pnl, 0), n_win)
+    avg_loss = np.abs(grouped_mean(codes, np.where(loss, pnl, 0), n_loss))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wl_ratio = np.where(n_loss == 0, np.inf, avg_win / avg_loss)
+        p = n_win / n
+        q = 1 - p
+        # Betting Method's p / a - q / b at the strategy's own average loss
+        betting = np.where(avg_loss > 0, p / avg_loss - q / avg_win, np.nan)
+        # K1's payoffs take two values (wl_ratio and -1), where the root of
+        # the log-wealth derivative is p - q / wl_ratio. With no wins
+        # wl_ratio is NaN and, as in growth_optimal_fraction, nothing is
+        # risked.
+        k1 = np.where(n_win == 0, 0.0, np.clip(p - q / wl_ratio, 0, max_risk))
+
+    return pd.DataFrame({
+        "Trades": n.astype(np.int64),
+        "Mean PnL": mu,
+        "Variance": sigma_sq,
+        "Thorp Kelly": (mu - rf_rate) / sigma_sq,
+        "Win Rate": p,
+        "Avg Win": avg_win,
+        "Avg Loss": avg_loss,
+        "Win/Loss Ratio": wl_ratio,
+        "Betting Kelly": betting,
+        "K1 Optimal Risk": k1,
+    })
+
+def kelly_summary(path, rf_rate=0.0, strategy_column="Strategy", max_risk=1.0):
+    codes, strategies, pnl = group_codes(load_trade_logs(path, strategy_column), strategy_column)
+    summary = kelly_stats(codes, pnl, len(strategies), rf_rate, max_risk)
+    summary.insert(0, "Strategy", strategies)
+    return summary
+
+def betting_curves(summary, a_values=np.linspace(0.00, .2, 100)):
+    # Betting Method's f-vs-a curve for every strategy: (n_strategies, n_a)
+    p = summary["Win Rate"].to_numpy()[:, None]
+    b = summary["Avg Win"].to_numpy()[:, None]
+    a = np.asarray(a_values)[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_values = np.where(a > 0, p / a - (1 - p) / b, np.nan)
+    return pd.DataFrame(f_values, index=summary["Strategy"], columns=a_values)
+
+def write_summary(path, out_path="kelly_summary.csv", rf_rate=0.0, strategy_column="Strategy"):
+    summary = kelly_summary(path, rf_rate, strategy_column)
+    summary.to_csv(out_path, index=False)
+    return summary
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "Trades.csv"
+    out_path = sys.argv[2] if len(sys.argv) > 2 else "kelly_summary.csv"
+    print(write_summary(source, out_path).to_string(index=False))
@@ -0,0 +1,100 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from sizing.kernels import HAVE_NUMBA, win_loss_finals
+from sizing.paths import simulate_paths
+
+# Times the path kernels against the per-path Python loops they replaced, on
+# the same resampled bank. Run from Optimal Sizing/Codes:
+#   python -m sizing.benchmark
+
+def python_paths(pnl_sims, fractions, threshold):
+    # Combination's original monte_carlo and plot_ruin_rate loops: the final
+    # value (0 once it reaches <= 0), np.var of the values before that, and
+    # whether the value ever fell to <= threshold * peak.
+    final = np.empty((len(fractions), len(pnl_sims)))
+    variance = np.empty((len(fractions), len(pnl_sims)))
+    ruined = np.empty((len(fractions), len(pnl_sims)), dtype=bool)
+    for i, f in enumerate(fractions):
+        for k, pnl_sim in enumerate(pnl_sims):
+            portfolio = 1
+            portfolio_values = []
+            for pnl in pnl_sim:
+                portfolio *= 1 + f * pnl
+                if portfolio <= 0:
+                    portfolio = 0
+                    break
+                portfolio_values.append(portfolio)
+            final[i, k] = portfolio
+            variance[i, k] = np.var(portfolio_values) if portfolio_values else 0
+
+            portfolio = 1
+            max_value = 1
+            ruin = False
+            for pnl in pnl_sim:
+                portfolio *= 1 + f * pnl
+                max_value = max(max_value, portfolio)
+                if portfolio <= threshold * max_value:
+                    ruin = True
+                    break
+            ruined[i, k] = ruin
+    return final, variance, ruined
+
+def python_win_loss(wins, risks, wl_ratio):
+    # K1's original simulate loop.
+    final = np.empty((len(risks), len(wins)))
+    for i, risk in enumerate(risks):
+        for k, path in enumerate(wins):
+            portfolio_value = 1
+            for win in path:
+                portfolio_value *= (1 + risk * wl_ratio) if win else (1 - risk)
+            final[i, k] = portfolio_value
+    return final
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def benchmark(file_path="Trades.csv", sims=100000, size=150, kelly_steps=5, threshold=0.25, seed=0):
+    pnl_values = pd.read_csv(file_path)["PnL"].values
+    rng = np.random.default_rng(seed)
+    pnl_sims = rng.choice(pnl_values, size=(sims, size), replace=True)
+    wins = pnl_sims > 0
+
+    kelly = np.mean(pnl_values) / np.var(pnl_values)
+    fractions = np.linspace(0.01, 2.5, kelly_steps) * kelly
+    losses = pnl_values[pnl_values < 0]
+    wl_ratio = np.mean(pnl_values[pnl_values > 0]) / np.abs(np.mean(losses))
+    risks = np.linspace(0.01, 1, kelly_steps)
+
+    backends = ["numpy"] + (["numba"] if HAVE_NUMBA else [])
+    rows = []
+
+    seconds, (final, _, ruined) = timed(python_paths, pnl_sims, fractions, threshold)
+    rows.append({"Kernel": "paths", "Backend": "python", "Seconds": seconds, "Max Abs Diff": 0.0})
+    for backend in backends:
+        # First call compiles the numba kernel
+        simulate_paths(pnl_sims[:2], fractions[:1], threshold, backend=backend)
+        seconds, metrics = timed(simulate_paths, pnl_sims, fractions, threshold, backend=backend)
+        assert np.array_equal(metrics.ruin_step >= 0, ruined)
+        rows.append({"Kernel": "paths", "Backend": backend, "Seconds": seconds,
+                     "Max Abs Diff": np.max(np.abs(metrics.final - final))})
+
+    seconds, final = timed(python_win_loss, wins, risks, wl_ratio)
+    rows.append({"Kernel": "win_loss", "Backend": "python", "Seconds": seconds, "Max Abs Diff": 0.0})
+    for backend in backends:
+        win_loss_finals(wins[:2], risks[:1], wl_ratio, backend)
+        seconds, result = timed(win_loss_finals, wins, risks, wl_ratio, backend)
+        rows.append({"Kernel": "win_loss", "Backend": backend, "Seconds": seconds,
+                     "Max Abs Diff": np.max(np.abs(result - final))})
+
+    results = pd.DataFrame(rows)
+    python_seconds = results.groupby("Kernel")["Seconds"].transform("first")
+    results["Speed-up"] = python_seconds / results["Seconds"]
+    return results
+
+if __name__ == "__main__":
+    print(benchmark().to_string(index=False))
@@ -0,0 +1,73 @@
+from collections import namedtuple
+
+import numpy as np
+
+from omega.instrument import stage
+from sizing.runner import run_blocks
+
+Simulation = namedtuple("Simulation", ["indices", "cum_ret", "max_dd", "sharpe", "sortino", "final_ret"])
+
+def max_drawdowns(cum_ret):
+    return (cum_ret - np.maximum.accumulate(cum_ret, axis=1)).min(axis=1)
+
+def path_stats(paths, indices=None, rf=0.0):
+    # Row-wise versions of the Monte Carlo scripts' cum_ret, max_dd, sharpe
+    # and sortino for an (n_sims, n_trades) array of trade PnLs.
+    with stage("stats.paths"):
+        cum_ret = np.cumsum(paths, axis=1)
+        max_dd = max_drawdowns(cum_ret)
+
+    with stage("stats.ratios"):
+        excess = paths - rf
+        mean = excess.mean(axis=1)
+        neg = excess < 0
+        n_neg = neg.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            neg_mean = np.where(neg, excess, 0).sum(axis=1) / n_neg
+            downside_dev = np.sqrt(np.where(neg, (excess - neg_mean[:, None]) ** 2, 0).sum(axis=1) / n_neg)
+            sortino = mean / downside_dev
+        sharpe = mean / excess.std(axis=1)
+    return Simulation(indices, cum_ret, max_dd, sharpe, sortino, cum_ret[:, -1])
+
+def concat_simulations(blocks):
+    return Simulation(*(None if parts[0] is None else np.concatenate(parts) for parts in zip(*blocks)))
+
+def bootstrap_block(pnl, rf, n_sims, rng):
+    with stage("bootstrap.draw"):
+        indices = rng.integers(0, len(pnl), size=(n_sims, len(pnl)))
+        paths = pnl[indices]
+    return path_stats(paths, indices, rf)
+
+def permutation_block(pnl, rf, keep_paths, n_sims, rng):
+    # Reorderings of the same trades, as in Resample.py. Sharpe, Sortino and
+    # the final return do not depend on the order, so they are computed once
+    # from pnl; only the drawdown is evaluated per path. Permutations are the
+    # argsort of a uniform matrix.
+    base = path_stats(pnl[None, :], rf=rf)
+    with stage("permute.draw"):
+        order = np.argsort(rng.random((n_sims, len(pnl))), axis=1)
+    with stage("permute.paths"):
+        cum_ret = np.cumsum(pnl[order], axis=1)
+        max_dd = max_drawdowns(cum_ret)
+    return Simulation(
+        order if keep_paths else None,
+        cum_ret if keep_paths else None,
+        max_dd,
+        np.full(n_sims, base.sharpe[0]),
+        np.full(n_sims, base.sortino[0]),
+        np.full(n_sims, base.final_ret[0]),
+    )
+
+def bootstrap(pnl, n_sims=1000, rf=0.0, seed=None, block_size=65536, workers=1):
+    # Draws the (n_sims, n_trades) resampling index matrix once; every
+    # statistic, plot and percentile reads the same simulated paths. Blocks
+    # are seeded through sizing.runner, so the result for a seed does not
+    # depend on workers.
+    pnl = np.asarray(pnl, dtype=np.float64)
+    return concat_simulations(run_blocks(bootstrap_block, (pnl, rf), n_sims, seed, block_size, workers))
+
+def permute(pnl, n_sims=1000, rf=0.0, seed=None, block_size=65536, keep_paths=True, workers=1):
+    # With keep_paths=False the indices and equity curves are not kept,
+    # which is what lets millions of permutations fit in memory.
+    pnl = np.asarray(pnl, dtype=np.float64)
+    return concat_simulations(run_blocks(permutation_block, (pnl, rf, keep_paths), n_sims, seed, block_size, workers))
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from omega.instrument import stage
+from sizing.paths import resample_paths
+from omega.results import cached
+
+def load_data(file_path):
+    trades = pd.read_csv(file_path)
+    if 'PnL' not in trades.columns:
+        raise ValueError("The file must contain a 'PnL' column.")
+    return trades['PnL'].values
+
+def calc_thorp_kelly(mu, sigma_sq, rf_rate):
+    return (mu - rf_rate) / sigma_sq
+
+def calc_stats(pnl_values):
+    mu = np.mean(pnl_values)
+    sigma_sq = np.var(pnl_values)
+    avg_loss = np.mean(pnl_values[pnl_values < 0])
+    return mu, sigma_sq, avg_loss
+
+def simulate(file_path, rf_rate, kelly_steps, sims, size=100, threshold=0.75, seed=None, backend="auto", workers=1, use_cache=True):
+    # Seeded runs are cached on Trades.csv and every parameter except the
+    # backend and worker count, which do not change the result.
+    if use_cache and seed is not None:
+        params = {"rf_rate": rf_rate, "kelly_steps": kelly_steps, "sims": sims, "size": size, "threshold": threshold}
+
+        def compute():
+            return simulate(file_path, rf_rate, kelly_steps, sims, size, threshold, seed, backend, workers, use_cache=False)
+
+        return cached("combination.simulate", [file_path], params, compute, seed)
+
+    pnl_values = load_data(file_path)
+    mu, sigma_sq, avg_loss = calc_stats(pnl_values)
+    opt_kelly = calc_thorp_kelly(mu, sigma_sq, rf_rate)
+
+    kelly_fractions = np.linspace(0.01, 2.5, kelly_steps) * opt_kelly
+    amount_risked = kelly_fractions * abs(avg_loss) * 100
+
+    # One bank of resampled paths shared by every Kelly fraction
+    metrics = resample_paths(pnl_values, kelly_fractions, sims, size, threshold, seed, backend, workers=workers)
+    with stage("combination.metrics"):
+        median_returns = np.median(metrics.final, axis=1).tolist()
+        median_vars = np.median(metrics.variance, axis=1).tolist()
+        ruin_rates = (metrics.ruin_step >= 0).mean(axis=1).tolist()
+
+    return amount_risked, median_returns, median_vars, ruin_rates, mu, sigma_sq, avg_loss
+
+# The old two-call API (monte_carlo, then Combination.plot_ruin_rate) must
+# draw the same paths in both calls, so both default to this seed.
+DEFAULT_SEED = 0
+
+def monte_carlo(file_path, rf_rate, kelly_steps, sims, size=100, seed=DEFAULT_SEED, workers=1):
+    amount_risked, median_returns, median_vars, _, mu, sigma_sq, avg_loss = simulate(
+        file_path, rf_rate, kelly_steps, sims, size, seed=seed, workers=workers
+    )
+    return amount_risked, median_returns, median_vars, mu, sigma_sq, avg_loss
+
+def size_ratios(file_path, rf_rate, amount_risked, median_returns, median_vars):
+    # Van Tharp's risk size against the simulated maximum-median-return size
+    pnl_values = load_data(file_path)
+    mu, sigma_sq, avg_loss = calc_stats(pnl_values)
+
+    van_thorp_kelly = calc_thorp_kelly(mu, sigma_sq, rf_rate)
+    van_thorp_risk_size = van_thorp_kelly * abs(avg_loss) * 100
+
+    max_return_idx = np.argmax(median_returns)
+    opt_risk_size = amount_risked[max_return_idx]
+
+    opt_median_return = median_returns[max_return_idx]
+    opt_median_variance = median_vars[max_return_idx]
+
+    van_thorp_idx = np.argmin(np.abs(amount_risked - van_thorp_risk_size))
+    van_thorp_median_return = median_returns[van_thorp_idx]
+    van_thorp_median_variance = median_vars[van_thorp_idx]
+
+    return {
+        "Van Thorp Risk Size": float(van_thorp_risk_size),
+        "Opt Risk Size": float(opt_risk_size),
+        "Risk Size Ratio": float(van_thorp_risk_size / opt_risk_size),
+        "Median Return Ratio": float(van_thorp_median_return / opt_median_return),
+        "Median Variance Ratio": float(van_thorp_median_variance / opt_median_variance),
+    }
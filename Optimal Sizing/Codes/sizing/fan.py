@@ -0,0 +1,37 @@
+import numpy as np
+
+# Above this many paths, plot_sims/plot_simulations switch from one line per
+# path to the fan chart.
+MAX_PATH_LINES = 1000
+
+def quantile_bands(cum_ret, levels=(5, 25, 50, 75, 95)):
+    # (len(levels), n_trades) percentiles of the equity curves at each trade
+    # index.
+    return np.percentile(cum_ret, levels, axis=0)
+
+def path_density(cum_ret, bins=200):
+    # Share of paths in each (value bin, trade index) cell, as a (bins,
+    # n_trades) image, with the value bin edges.
+    n_sims, n_trades = cum_ret.shape
+    edges = np.linspace(cum_ret.min(), cum_ret.max(), bins + 1)
+    trade = np.broadcast_to(np.arange(n_trades), cum_ret.shape)
+    hist, _, _ = np.histogram2d(trade.ravel(), cum_ret.ravel(), bins=[np.arange(n_trades + 1) - 0.5, edges])
+    return hist.T / n_sims, edges
+
+def draw_fan(ax, cum_ret, bands=((5, 95), (25, 75)), density=False, bins=200, color="blue"):
+    # Fan chart of an (n_sims, n_trades) path matrix on a matplotlib Axes:
+    # one filled polygon per band plus the median line, and optionally the
+    # path density underneath as a single image. The number of artists does
+    # not depend on n_sims.
+    trades = np.arange(cum_ret.shape[1])
+    if density:
+        image, edges = path_density(cum_ret, bins)
+        ax.imshow(image, origin="lower", aspect="auto", cmap="Blues",
+                  extent=(-0.5, len(trades) - 0.5, edges[0], edges[-1]))
+
+    levels = sorted({level for band in bands for level in band} | {50})
+    values = dict(zip(levels, quantile_bands(cum_ret, levels)))
+    for i, (low, high) in enumerate(bands):
+        ax.fill_between(trades, values[low], values[high], color=color, alpha=0.15 + 0.1 * i,
+                        linewidth=0, label=f"{low}th-{high}th Percentile")
+    ax.plot(trades, values[50], color=color, linewidth=1, label="Median")
@@ -0,0 +1,61 @@
+import numpy as np
+
+def win_loss_payoffs(wins, wl_ratio):
+    # K1's rule as per-trade payoffs x: wealth is multiplied by 1 + r * x,
+    # with x = wl_ratio on a win and -1 otherwise.
+    return np.where(np.asarray(wins, dtype=bool), wl_ratio, -1.0)
+
+def _distinct(payoffs):
+    values, counts = np.unique(np.asarray(payoffs, dtype=np.float64), return_counts=True)
+    return values, counts.astype(np.float64)
+
+def log_wealth(payoffs, risks):
+    # log terminal wealth sum(log1p(r * x)) for every risk level at once.
+    # Only the multiset of payoffs matters, so repeated payoffs are counted
+    # rather than walked.
+    values, counts = _distinct(payoffs)
+    risks = np.asarray(risks, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log1p(risks[..., None] * values) @ counts
+
+def terminal_wealth(payoffs, risks):
+    with np.errstate(invalid="ignore"):
+        return np.exp(log_wealth(payoffs, risks))
+
+def growth_optimal_fraction(payoffs, max_risk=1.0, tol=1e-12, max_iter=100):
+    # Root of d/dr log_wealth = sum(x / (1 + r * x)) on [0, max_risk]. The
+    # derivative is strictly decreasing, so Newton steps are kept inside a
+    # shrinking bracket and fall back to bisection when they leave it.
+    values, counts = _distinct(payoffs)
+
+    def slope(r):
+        return np.sum(counts * values / (1 + r * values))
+
+    def curvature(r):
+        return -np.sum(counts * values ** 2 / (1 + r * values) ** 2)
+
+    # No losing payoff: wealth grows with r all the way to max_risk. Checked
+    # before any slope, which is nan for a wl_ratio of inf.
+    if values[0] >= 0:
+        return float(max_risk) if values[-1] > 0 else 0.0
+    # Wealth hits 0 at r = -1 / min(x)
+    bust = -1 / values[0]
+    if slope(0.0) <= 0:
+        return 0.0
+    if max_risk < bust and slope(max_risk) >= 0:
+        return float(max_risk)
+
+    lo, hi = 0.0, min(max_risk, bust)
+    r = hi / 2
+    for _ in range(max_iter):
+        g = slope(r)
+        if g > 0:
+            lo = r
+        else:
+            hi = r
+        step = r - g / curvature(r)
+        r_next = step if lo < step < hi else (lo + hi) / 2
+        if abs(r_next - r) <= tol:
+            return float(r_next)
+        r = r_next
+    return float(r)
@@ -0,0 +1,103 @@
+import warnings
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+def jit(func):
+    # Compiled with numba when it is installed, otherwise the plain Python
+    # function. Either way the original stays reachable as .py_func.
+    if numba is None:
+        func.py_func = func
+        return func
+    return numba.njit(cache=True, parallel=True, nogil=True)(func)
+
+prange = numba.prange if HAVE_NUMBA else range
+
+def resolve_backend(backend):
+    # "auto" stays on NumPy: the compiled kernels are experimental and
+    # opt-in with backend="numba" until tests/test_kernels.py has passed on a
+    # numba install. Without numba, "numba" falls back to NumPy with a
+    # warning.
+    if backend not in ("auto", "numba", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+    if backend == "numba" and not HAVE_NUMBA:
+        warnings.warn("numba is not installed; using the NumPy backend.", RuntimeWarning, stacklevel=3)
+        return "numpy"
+    return "numpy" if backend == "auto" else backend
+
+@jit
+def path_metrics_kernel(pnl_sims, fractions, threshold, final, variance, peak, max_drawdown, ruin_step):
+    # Per-path loop with the same update order as paths._accumulate, so both
+    # backends give the same numbers. A path stops at the trade that busts it.
+    n_sims, n_trades = pnl_sims.shape
+    for k in prange(n_sims):
+        for i in range(fractions.shape[0]):
+            f = fractions[i]
+            value = 1.0
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            top = 1.0
+            deepest = 0.0
+            ruined = -1
+            for step in range(n_trades):
+                value *= 1 + f * pnl_sims[k, step]
+                if value <= 0:
+                    value = 0.0
+                    deepest = 1.0
+                    if ruined < 0 and threshold * top >= 0:
+                        ruined = step
+                    break
+                count += 1
+                delta = value - mean
+                mean += delta / count
+                m2 += delta * (value - mean)
+                if value > top:
+                    top = value
+                drawdown = 1 - value / top
+                if drawdown > deepest:
+                    deepest = drawdown
+                if ruined < 0 and value <= threshold * top:
+                    ruined = step
+            final[i, k] = value
+            variance[i, k] = m2 / max(count, 1)
+            peak[i, k] = top
+            max_drawdown[i, k] = deepest
+            ruin_step[i, k] = ruined
+
+@jit
+def win_loss_kernel(wins, risks, wl_ratio, final):
+    # K1's sizing rule: a win multiplies by 1 + risk * wl_ratio, anything
+    # else by 1 - risk.
+    n_sims, n_trades = wins.shape
+    for k in prange(n_sims):
+        for i in range(risks.shape[0]):
+            up = 1 + risks[i] * wl_ratio
+            down = 1 - risks[i]
+            value = 1.0
+            for step in range(n_trades):
+                value *= up if wins[k, step] else down
+            final[i, k] = value
+
+def win_loss_finals(wins, risks, wl_ratio, backend="auto"):
+    # Final value of every (risk, path) under K1's rule. wins is a boolean
+    # (n_sims, n_trades) array.
+    wins = np.atleast_2d(np.asarray(wins, dtype=bool))
+    risks = np.atleast_1d(np.asarray(risks, dtype=np.float64))
+    if resolve_backend(backend) == "numba":
+        final = np.empty((len(risks), wins.shape[0]))
+        win_loss_kernel(wins, risks, float(wl_ratio), final)
+        return final
+
+    up = (1 + risks * wl_ratio)[:, None]
+    down = (1 - risks)[:, None]
+    final = np.ones((len(risks), wins.shape[0]))
+    for win in np.ascontiguousarray(wins.T):
+        final *= np.where(win, up, down)
+    return final
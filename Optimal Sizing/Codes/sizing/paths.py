@@ -0,0 +1,110 @@
+from collections import namedtuple
+
+import numpy as np
+
+from omega.instrument import stage
+from sizing.kernels import path_metrics_kernel, resolve_backend
+from sizing.runner import run_blocks
+
+PathMetrics = namedtuple("PathMetrics", ["final", "variance", "peak", "max_drawdown", "ruin_step"])
+
+# Number of (fraction, path) float64 state arrays _accumulate keeps alive,
+# temporaries included.
+STATE_ARRAYS = 12
+
+def block_shape(n_fractions, n_sims, memory_budget):
+    # (fractions, paths) per block so that the block's per-path state fits in
+    # memory_budget bytes. Small blocks stay cache resident across the steps.
+    cells = max(1, memory_budget // (8 * STATE_ARRAYS))
+    rows = min(n_sims, cells)
+    return min(n_fractions, max(1, cells // rows)), rows
+
+def _accumulate(f, steps, threshold):
+    # One pass over the trades with O(1) state per path: current value,
+    # Welford mean/M2 of the pre-bust values, running peak, max drawdown and
+    # the first step at which the value fell to threshold * peak.
+    shape = (f.shape[0], steps.shape[1])
+    value = np.ones(shape)
+    count = np.zeros(shape)
+    mean = np.zeros(shape)
+    m2 = np.zeros(shape)
+    peak = np.ones(shape)
+    max_drawdown = np.zeros(shape)
+    ruin_step = np.full(shape, -1)
+    alive = np.ones(shape, dtype=bool)
+
+    for step, pnl in enumerate(steps):
+        value *= 1 + f * pnl
+        # A bust path is pinned at 0 for the rest of the run, which is both
+        # its final value and a 100% drawdown.
+        bust = alive & (value <= 0)
+        np.copyto(value, 0.0, where=bust)
+        alive &= ~bust
+
+        count += alive
+        delta = np.where(alive, value - mean, 0.0)
+        mean += delta / np.maximum(count, 1)
+        m2 += delta * (value - mean)
+
+        np.maximum(peak, value, out=peak)
+        np.maximum(max_drawdown, 1 - value / peak, out=max_drawdown)
+        hit = (ruin_step < 0) & (value <= threshold * peak)
+        ruin_step[hit] = step
+
+    variance = m2 / np.maximum(count, 1)
+    return value, variance, peak, max_drawdown, ruin_step
+
+def simulate_paths(pnl_sims, kelly_fractions, threshold=0.75, memory_budget=8 * 2**20, backend="auto"):
+    # Evaluates every Kelly fraction on the same resampled paths. For each
+    # (fraction, path):
+    #   final: end value, or 0 once the value reaches <= 0
+    #          (Combination.monte_carlo's "portfolio <= 0 -> 0 and stop");
+    #   variance: variance of the values before that point;
+    #   peak, max_drawdown: running peak (from 1) and deepest fall below it;
+    #   ruin_step: first trade at which the value was <= threshold * peak, or
+    #              -1 (Combination.plot_ruin_rate's ruin test).
+    # backend="numba" uses the compiled per-path kernel (NumPy, with a
+    # warning, when numba is missing); "auto" and "numpy" use the blocked
+    # NumPy pass.
+    pnl_sims = np.atleast_2d(np.asarray(pnl_sims, dtype=np.float64))
+    fractions = np.asarray(kelly_fractions, dtype=np.float64)
+    n_sims = pnl_sims.shape[0]
+
+    out = PathMetrics(
+        np.empty((len(fractions), n_sims)),
+        np.empty((len(fractions), n_sims)),
+        np.empty((len(fractions), n_sims)),
+        np.empty((len(fractions), n_sims)),
+        np.empty((len(fractions), n_sims), dtype=np.int64),
+    )
+    if resolve_backend(backend) == "numba":
+        path_metrics_kernel(pnl_sims, fractions, float(threshold), *out)
+        return out
+
+    # Trade-major layout so each step reads one contiguous row of draws
+    steps = np.ascontiguousarray(pnl_sims.T)
+    group, rows = block_shape(len(fractions), n_sims, memory_budget)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for f_start in range(0, len(fractions), group):
+            f = fractions[f_start:f_start + group, None]
+            for start in range(0, n_sims, rows):
+                block = (slice(f_start, f_start + group), slice(start, start + rows))
+                for target, values in zip(out, _accumulate(f, steps[:, start:start + rows], threshold)):
+                    target[block] = values
+    return out
+
+def path_block(pnl_values, n_trades, kelly_fractions, threshold, backend, n_sims, rng):
+    with stage("paths.draw"):
+        pnl_sims = rng.choice(pnl_values, size=(n_sims, n_trades), replace=True)
+    with stage("paths.simulate"):
+        return simulate_paths(pnl_sims, kelly_fractions, threshold, backend=backend)
+
+def resample_paths(pnl_values, kelly_fractions, n_sims, n_trades, threshold=0.75, seed=None, backend="auto", block_size=10000, workers=1):
+    # simulate_paths over n_sims bootstrap draws of n_trades trades, drawn and
+    # evaluated block by block through sizing.runner. Every Kelly fraction
+    # sees the same paths, and the result for a seed does not depend on
+    # workers.
+    args = (np.asarray(pnl_values, dtype=np.float64), n_trades, kelly_fractions, threshold, backend)
+    blocks = run_blocks(path_block, args, n_sims, seed, block_size, workers)
+    return PathMetrics(*(np.concatenate(parts, axis=1) for parts in zip(*blocks)))
@@ -0,0 +1,82 @@
+import numpy as np
+
+from sizing.fan import MAX_PATH_LINES, draw_fan
+
+# Figure builders for the sizing scripts and the CLI. matplotlib is imported
+# on first use, so importing sizing never pays for it. Builders return the
+# Figure; scripts call show(), the CLI saves to files.
+
+def pyplot():
+    import matplotlib.pyplot as plt
+    return plt
+
+def show():
+    pyplot().show()
+
+def sizing_figure(amount_risked, median_returns, median_vars, ruin_rates, threshold, opt_kelly_risk):
+    # Combination's normalized median return/variance and ruin rate
+    plt = pyplot()
+    max_return = max(median_returns)
+    max_variance = max(median_vars)
+
+    norm_returns = [r / max_return for r in median_returns]
+    norm_vars = [v / max_variance for v in median_vars]
+
+    max_return_idx = np.argmax(median_returns)
+    max_return_risk = amount_risked[max_return_idx]
+
+    fig, ax = plt.subplots(figsize=(14, 7))
+
+    ax.plot(amount_risked, norm_vars, label='Normalized Median Variance', color='orange')
+    ax.plot(amount_risked, norm_returns, label='Normalized Median Return', color='blue')
+    ax.plot(amount_risked, ruin_rates, label=f'Ruin Rate (Threshold {threshold})', color='red')
+    ax.axvline(x=opt_kelly_risk, color='green', linestyle='--', label='Optimal Van Thorp Risk Size')
+    ax.axvline(x=max_return_risk, color='purple', linestyle='--', label='Maximum Median Return')
+
+    ax.set_xlabel('Amount Risked per Trade (%)')
+    ax.set_ylabel('Normalized Metric (Fraction of Max)')
+    ax.set_title('Simulation: Normalized Metrics vs Risk Size')
+    ax.grid(True)
+    ax.legend(loc="upper left")
+    return fig
+
+def paths_figure(pnl, cum_ret, title, mode='auto', density=False):
+    # mode='paths' draws every path, 'fan' draws percentile bands; 'auto'
+    # switches to the fan above MAX_PATH_LINES paths.
+    plt = pyplot()
+    if mode == 'auto':
+        mode = 'paths' if len(cum_ret) <= MAX_PATH_LINES else 'fan'
+    fig = plt.figure(figsize=(14, 7))
+    if mode == 'fan':
+        draw_fan(plt.gca(), cum_ret, density=density)
+    else:
+        plt.plot(cum_ret.T, color='blue', alpha=0.05)
+    plt.plot(np.cumsum(pnl), color='black', linewidth=1.5, label='Original Equity Curve')
+    plt.title(title)
+    plt.xlabel('Trade Index')
+    plt.ylabel('Cumulative Return')
+    plt.legend()
+    plt.grid(True)
+    return fig
+
+def percentile_figure(pcts):
+    # Final cumulative return at each of the 0-100 percentiles
+    plt = pyplot()
+    fig = plt.figure(figsize=(14, 7))
+    plt.plot(np.linspace(0, 100, len(pcts)), pcts, color='blue', linewidth=2)
+    plt.title('Final Cumulative Returns vs Percentile')
+    plt.xlabel('Percentile')
+    plt.ylabel('Final Cumulative Return')
+    plt.grid(True)
+    return fig
+
+def kelly_curve_figure(risks, final_returns, title, xlabel, ylabel):
+    plt = pyplot()
+    fig = plt.figure(figsize=(14, 7))
+    plt.plot(risks, final_returns, label="Final Cumulative Return", color='blue')
+    plt.title(title)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.grid(True)
+    plt.legend()
+    return fig
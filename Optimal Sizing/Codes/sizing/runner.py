@@ -0,0 +1,49 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+def _run_block(task):
+    func, args, size, seed_seq = task
+    return func(*args, size, np.random.default_rng(seed_seq))
+
+def iter_blocks(func, args, n_sims, seed=None, block_size=65536, workers=1):
+    # Splits n_sims into blocks of block_size and yields func(*args, size,
+    # rng) for each block, in block order. Block i always draws from the i-th
+    # SeedSequence child of seed, so results depend on seed and block_size
+    # but not on the worker count. Tasks are created as they are submitted
+    # and at most two per worker are in flight, so memory does not grow with
+    # the number of blocks. func must be importable (module level) to reach
+    # pool workers. workers=None uses every core.
+    parent = np.random.SeedSequence(seed)
+    # spawn(1) repeatedly yields the same children as one spawn(n)
+    tasks = ((func, args, min(block_size, n_sims - start), parent.spawn(1)[0]) for start in range(0, n_sims, block_size))
+    n_blocks = -(-n_sims // block_size)
+    workers = min(workers or os.cpu_count(), n_blocks)
+
+    if workers <= 1:
+        for task in tasks:
+            yield _run_block(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_run_block, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def run_blocks(func, args, n_sims, seed=None, block_size=65536, workers=1):
+    # Every block's result, as a list in block order.
+    return list(iter_blocks(func, args, n_sims, seed, block_size, workers))
+
+def fold_blocks(func, args, combine, n_sims, seed=None, block_size=65536, workers=1):
+    # combine(result, block) applied to each block as it arrives, in block
+    # order, so only the running result and the in-flight blocks are held.
+    blocks = iter_blocks(func, args, n_sims, seed, block_size, workers)
+    result = next(blocks)
+    for block in blocks:
+        result = combine(result, block)
+    return result
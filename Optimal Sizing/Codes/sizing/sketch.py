@@ -0,0 +1,98 @@
+import numpy as np
+
+from sizing.bootstrap import bootstrap_block, permutation_block
+from sizing.runner import fold_blocks
+
+class QuantileSketch:
+    # KLL quantile sketch. Level h holds values standing for 2**h samples
+    # each; a full level is sorted and every other value (random offset) is
+    # promoted. Memory stays O(k) whatever the number of values seen, and
+    # rank error is about 1.7 / k of the count with high probability.
+    # Sketches with the same k merge into a sketch of the union.
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(8, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError("Only sketches with the same k can be merged.")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        while sum(len(values) for values in self.levels) > sum(self.capacity(h) for h in range(len(self.levels))):
+            for level, values in enumerate(self.levels):
+                if len(values) >= self.capacity(level):
+                    break
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            values = np.sort(values)
+            # An odd value out stays behind so total weight is preserved
+            keep = values[len(values) - len(values) % 2:]
+            pairs = values[:len(values) - len(values) % 2]
+            promoted = pairs[self.rng.integers(2)::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+    def percentile(self, q):
+        # Like np.percentile with q in [0, 100], to within the rank error.
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(v), 2.0 ** h) for h, v in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        ranks = np.cumsum(weights[order])
+        targets = np.asarray(q, dtype=np.float64) / 100 * ranks[-1]
+        return values[np.minimum(np.searchsorted(ranks, targets), len(values) - 1)]
+
+    def __len__(self):
+        return sum(len(values) for values in self.levels)
+
+def percentiles(values, q):
+    # np.percentile for arrays, sketch lookup for QuantileSketch.
+    if isinstance(values, QuantileSketch):
+        return values.percentile(q)
+    return np.percentile(values, q)
+
+METRICS = ("max_dd", "sharpe", "sortino", "final_ret")
+
+def sketch_block(method, pnl, rf, k, n_sims, rng):
+    if method == "permute":
+        sims = permutation_block(pnl, rf, False, n_sims, rng)
+    else:
+        sims = bootstrap_block(pnl, rf, n_sims, rng)
+    return {metric: QuantileSketch(k, rng.integers(2**63)).update(getattr(sims, metric)) for metric in METRICS}
+
+def merge_sketches(sketches, block):
+    for metric in METRICS:
+        sketches[metric].merge(block[metric])
+    return sketches
+
+def sketch_simulations(pnl, n_sims=1000000, method="bootstrap", rf=0.0, seed=None, block_size=16384, k=200, workers=1):
+    # Runs the bootstrap or permutation simulation block_size paths at a time
+    # and keeps only a QuantileSketch per metric, so memory depends on
+    # block_size, k and workers but not on n_sims. Each block's sketches are
+    # merged into the running ones as it arrives, in block order, so the
+    # result for a seed does not depend on workers.
+    if method not in ("bootstrap", "permute"):
+        raise ValueError(f"Unknown method: {method!r}")
+    pnl = np.asarray(pnl, dtype=np.float64)
+    return fold_blocks(sketch_block, (method, pnl, rf, k), merge_sketches, n_sims, seed, block_size, workers)
@@ -0,0 +1,20 @@
+import os
+
+import numpy as np
+
+import Combination
+from sizing.combination import simulate
+
+TRADES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trades.csv")
+
+def test_two_call_api_shares_paths_with_simulate(monkeypatch):
+    monkeypatch.setenv("OMEGA_RESULT_CACHE", "0")
+    args = (TRADES, 0.0, 10, 200)
+    amount_risked, median_returns, median_vars, _, _, _ = Combination.monte_carlo(*args, size=50)
+    ruin_rates = Combination.plot_ruin_rate(TRADES, 0.0, amount_risked, median_returns, 10, 200, size=50, threshold=0.25)
+
+    expected = simulate(*args, size=50, threshold=0.25, seed=0, use_cache=False)
+    np.testing.assert_array_equal(amount_risked, expected[0])
+    assert median_returns == expected[1]
+    assert median_vars == expected[2]
+    assert ruin_rates == expected[3]
@@ -0,0 +1,24 @@
+import numpy as np
+
+from sizing.batch import kelly_stats
+from sizing.kelly import growth_optimal_fraction, log_wealth, win_loss_payoffs
+
+def test_growth_optimal_fraction_matches_fine_grid():
+    payoffs = win_loss_payoffs(np.arange(59) % 2 == 0, 3.18)
+    risks = np.linspace(0, 1, 200001)
+    expected = risks[np.argmax(log_wealth(payoffs, risks))]
+    assert abs(growth_optimal_fraction(payoffs) - expected) < 1e-5
+
+def test_no_losing_trades_takes_max_risk():
+    pnl = np.array([0.01, 0.02, 0.005])
+    for wl_ratio in (np.inf, 2.0):
+        assert growth_optimal_fraction(win_loss_payoffs(pnl > 0, wl_ratio), max_risk=0.8) == 0.8
+    # Strategy 0 never loses, strategy 1 never wins
+    batch_pnl = np.concatenate([pnl, -pnl])
+    codes = np.repeat([0, 1], len(pnl))
+    summary = kelly_stats(codes, batch_pnl, 2, max_risk=0.8)
+    assert summary["K1 Optimal Risk"].tolist() == [0.8, 0.0]
+    assert growth_optimal_fraction(win_loss_payoffs(-pnl > 0, np.nan), max_risk=0.8) == 0.0
+
+def test_no_winning_trades_takes_no_risk():
+    assert growth_optimal_fraction(win_loss_payoffs(np.zeros(10, dtype=bool), 2.0)) == 0.0
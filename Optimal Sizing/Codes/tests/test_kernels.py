@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from sizing.kernels import HAVE_NUMBA, path_metrics_kernel, win_loss_finals, win_loss_kernel
+from sizing.paths import PathMetrics, simulate_paths
+
+def draws(n_sims=300, n_trades=80, seed=0):
+    # Trade PnL wide enough that the larger fractions bust some paths
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.004, 0.05, size=(n_sims, n_trades))
+
+FRACTIONS = np.linspace(0.01, 25, 12)
+
+def kernel_paths(kernel, pnl_sims, fractions, threshold):
+    shape = (len(fractions), len(pnl_sims))
+    out = PathMetrics(np.empty(shape), np.empty(shape), np.empty(shape), np.empty(shape), np.empty(shape, dtype=np.int64))
+    kernel(pnl_sims, fractions, threshold, *out)
+    return out
+
+def kernel_win_loss(kernel, wins, risks, wl_ratio):
+    final = np.empty((len(risks), len(wins)))
+    kernel(wins, risks, wl_ratio, final)
+    return final
+
+def assert_same_paths(actual, expected):
+    assert np.any(expected.final == 0)
+    for name, a, b in zip(PathMetrics._fields, actual, expected):
+        np.testing.assert_array_equal(a, b, err_msg=name)
+
+def test_auto_backend_is_numpy():
+    pnl_sims = draws(50)
+    assert_same_paths(simulate_paths(pnl_sims, FRACTIONS, 0.75), simulate_paths(pnl_sims, FRACTIONS, 0.75, backend="numpy"))
+
+def test_path_kernel_python_matches_numpy():
+    # The uncompiled kernel runs the same loop numba compiles
+    pnl_sims = draws()
+    expected = simulate_paths(pnl_sims, FRACTIONS, 0.75, backend="numpy")
+    assert_same_paths(kernel_paths(path_metrics_kernel.py_func, pnl_sims, FRACTIONS, 0.75), expected)
+
+def test_win_loss_kernel_python_matches_numpy():
+    wins = draws() > 0
+    risks = np.linspace(0.01, 1, 20)
+    expected = win_loss_finals(wins, risks, 3.2, backend="numpy")
+    np.testing.assert_array_equal(kernel_win_loss(win_loss_kernel.py_func, wins, risks, 3.2), expected)
+
+@pytest.mark.skipif(HAVE_NUMBA, reason="numba is installed")
+def test_numba_backend_falls_back_to_numpy():
+    pnl_sims = draws(50)
+    with pytest.warns(RuntimeWarning, match="numba is not installed"):
+        metrics = simulate_paths(pnl_sims, FRACTIONS, 0.75, backend="numba")
+    assert_same_paths(metrics, simulate_paths(pnl_sims, FRACTIONS, 0.75, backend="numpy"))
+    with pytest.warns(RuntimeWarning):
+        final = win_loss_finals(pnl_sims > 0, np.linspace(0.01, 1, 5), 3.2, backend="numba")
+    np.testing.assert_array_equal(final, win_loss_finals(pnl_sims > 0, np.linspace(0.01, 1, 5), 3.2, backend="numpy"))
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        simulate_paths(draws(5), FRACTIONS, 0.75, backend="cuda")
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="numba is not installed")
+def test_numba_backend_matches_numpy():
+    pnl_sims = draws()
+    assert_same_paths(
+        simulate_paths(pnl_sims, FRACTIONS, 0.75, backend="numba"),
+        simulate_paths(pnl_sims, FRACTIONS, 0.75, backend="numpy"),
+    )
+    wins = pnl_sims > 0
+    risks = np.linspace(0.01, 1, 20)
+    np.testing.assert_array_equal(win_loss_finals(wins, risks, 3.2, backend="numba"), win_loss_finals(wins, risks, 3.2, backend="numpy"))
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sizing.benchmark import python_paths
+from sizing.combination import calc_stats, calc_thorp_kelly, load_data
+from sizing.paths import simulate_paths
+
+TRADES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trades.csv")
+
+def trade_draws(n_sims=200, n_trades=150, seed=0):
+    pnl_values = pd.read_csv(TRADES)["PnL"].values
+    return np.random.default_rng(seed).choice(pnl_values, size=(n_sims, n_trades), replace=True)
+
+def kelly_fractions(kelly_steps=8):
+    # Combination's grid, 0.01 to 2.5 times the Thorp Kelly fraction
+    mu, sigma_sq, _ = calc_stats(load_data(TRADES))
+    return np.linspace(0.01, 2.5, kelly_steps) * calc_thorp_kelly(mu, sigma_sq, 0.0)
+
+def wide_draws(n_sims=200, n_trades=80, seed=0):
+    # Wide enough that the larger fractions bust some paths
+    return np.random.default_rng(seed).normal(0.004, 0.05, size=(n_sims, n_trades))
+
+@pytest.mark.parametrize("pnl_sims, fractions, threshold", [
+    (trade_draws(), kelly_fractions(), 0.25),
+    (wide_draws(), np.linspace(0.01, 25, 8), 0.75),
+])
+def test_simulate_paths_matches_original_loops(pnl_sims, fractions, threshold):
+    final, variance, ruined = python_paths(pnl_sims, fractions, threshold)
+    metrics = simulate_paths(pnl_sims, fractions, threshold, backend="numpy")
+
+    np.testing.assert_allclose(metrics.final, final, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(metrics.variance, variance, rtol=1e-9, atol=1e-300)
+    np.testing.assert_array_equal(metrics.ruin_step >= 0, ruined)
+    # Both cases have busted, ruined and surviving paths
+    assert (final == 0).any() and ruined.any() and not ruined.all()
@@ -0,0 +1,64 @@
+import tracemalloc
+
+import numpy as np
+
+from sizing.runner import fold_blocks, run_blocks
+from sizing.sketch import METRICS, QuantileSketch, sketch_simulations
+
+PNL = np.random.default_rng(1).normal(0.004, 0.02, 59)
+Q = np.linspace(0, 100, 21)
+
+def draw_sum(n_sims, rng):
+    return rng.random(n_sims).sum()
+
+def test_fold_blocks_matches_run_blocks_for_any_worker_count():
+    expected = run_blocks(draw_sum, (), 10000, seed=7, block_size=999)
+    for workers in (1, 2):
+        folded = fold_blocks(draw_sum, (), lambda total, block: total + block, 10000, seed=7, block_size=999, workers=workers)
+        assert folded == sum(expected[1:], expected[0])
+
+def test_sketch_simulations_independent_of_workers():
+    for method in ("bootstrap", "permute"):
+        serial = sketch_simulations(PNL, 20000, method, seed=3, block_size=2048)
+        pooled = sketch_simulations(PNL, 20000, method, seed=3, block_size=2048, workers=2)
+        for metric in METRICS:
+            np.testing.assert_array_equal(serial[metric].percentile(Q), pooled[metric].percentile(Q))
+
+def peak_mb(n_sims):
+    tracemalloc.start()
+    sketch_simulations(PNL, n_sims, seed=0, block_size=2048)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+def test_sketch_memory_does_not_grow_with_n_sims():
+    assert peak_mb(200000) < 1.5 * peak_mb(20000)
+
+def rank_error(sketch, data, q):
+    # How far, in percentile points, each estimate's rank in the data lies
+    # from q (0 when q falls within the ranks of a tied value)
+    data = np.sort(data)
+    estimates = sketch.percentile(q)
+    below = 100 * np.searchsorted(data, estimates, "left") / len(data)
+    at_or_below = 100 * np.searchsorted(data, estimates, "right") / len(data)
+    return np.maximum(0, np.maximum(below - q, q - at_or_below))
+
+def test_sketch_rank_error_is_bounded():
+    # 1M values fed in blocks, both merged block by block as
+    # sketch_simulations does and through one sketch's update. Rank error
+    # stays within the documented 1.7 / k of the count.
+    k = 200
+    data = np.random.default_rng(0).lognormal(0, 1, 1000000)
+    blocks = np.array_split(data, 62)
+    merged = QuantileSketch(k, 0).update(blocks[0])
+    for i, block in enumerate(blocks[1:]):
+        merged.merge(QuantileSketch(k, i + 1).update(block))
+    updated = QuantileSketch(k, 0)
+    for block in blocks:
+        updated.update(block)
+
+    q = np.linspace(0, 100, 101)
+    for sketch in (merged, updated):
+        assert sketch.count == len(data)
+        assert len(sketch) < 10 * k
+        assert rank_error(sketch, data, q).max() <= 100 * 1.7 / k
@@ -0,0 +1,94 @@
+import argparse
+import json
+import os
+import sys
+
+from omega.cli import add_output_args, run
+
+# Headless entry point for batch jobs, run from QQQ-TLT Ratio/Code:
+#   python -m ratio backtest --out-dir out --figures
+# Metrics go to <out-dir>/<command>.json and, with --figures, figures to
+# <out-dir>/<command>*.png. numpy/pandas load only once a command runs and
+# matplotlib only with --figures. --data defaults to the bundled Data folder.
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+def table_records(result_df):
+    return json.loads(result_df.to_json(orient="records"))
+
+def best_row(result_df):
+    return table_records(result_df.loc[[result_df["Sharpe Ratio"].idxmax()]])[0]
+
+def backtest(args):
+    from ratio.frame import add_drawdowns, backtest_summary, create_df
+
+    df = create_df(args.ticker, args.data, args.period, args.lower, args.upper)
+    figures = [
+        ("backtest_returns", lambda plots: plots.returns_figure(df, args.ticker)),
+        ("backtest_drawdowns", lambda plots: plots.drawdown_figure(add_drawdowns(df, args.ticker), args.ticker)),
+    ]
+    return {"metrics": backtest_summary(df, args.ticker)}, figures
+
+def heatmap(args):
+    from ratio.sweep import sharpe_matrix
+
+    lowers = range(args.lower_range[0], args.lower_range[1] + 1)
+    uppers = range(args.upper_range[0], args.upper_range[1] + 1)
+    matrix = sharpe_matrix(args.ticker, args.data, args.period, lowers, uppers, args.workers, args.use_cache)
+    best = matrix.stack().idxmax()
+    result = {
+        "best": {"Lower Threshold": int(best[0]), "Upper Threshold": int(best[1]), "Sharpe Ratio": float(matrix.loc[best])},
+        "lower_thresholds": list(lowers),
+        "upper_thresholds": list(uppers),
+        "sharpe": matrix.to_numpy().tolist(),
+    }
+    return result, [("heatmap", lambda plots: plots.heatmap_figure(matrix, args.ticker, args.period))]
+
+def lower(args):
+    from ratio.sweep import lower_threshold_sharpes
+
+    start, end = args.lower_range
+    result_df = lower_threshold_sharpes(args.ticker, args.data, args.period, start, end, args.upper, args.workers, args.use_cache)
+    title = f"Sharpe Ratios for {args.ticker} Across Lower Threshold Values \n Lookback Period: {args.period}, Upper Threshold: {args.upper}"
+    figures = [("lower", lambda plots: plots.sweep_figure(result_df, "Lower Threshold", title))]
+    return {"best": best_row(result_df), "table": table_records(result_df)}, figures
+
+def upper(args):
+    from ratio.sweep import upper_threshold_sharpes
+
+    start, end = args.upper_range
+    result_df = upper_threshold_sharpes(args.ticker, args.data, args.period, args.lower, start, end, args.workers, args.use_cache)
+    title = f"Sharpe Ratios for {args.ticker} Across Upper Threshold Values \n Lookback Period: {args.period}, Lower Threshold: {args.lower}"
+    figures = [("upper", lambda plots: plots.sweep_figure(result_df, "Upper Threshold", title))]
+    return {"best": best_row(result_df), "table": table_records(result_df)}, figures
+
+def lookback(args):
+    from ratio.sweep import lookback_sharpes
+
+    start, end = args.lookback_range
+    result_df = lookback_sharpes(args.ticker, args.data, args.lower, args.upper, start, end, args.use_cache)
+    title = f"Sharpe Ratios for {args.ticker} Across Lookback Periods \n Lower Threshold: {args.lower}, Upper Threshold: {args.upper}"
+    figures = [("lookback", lambda plots: plots.sweep_figure(result_df, "Lookback Period", title, list(range(start, end + 1))))]
+    return {"best": best_row(result_df), "table": table_records(result_df)}, figures
+
+COMMANDS = {"backtest": backtest, "heatmap": heatmap, "lower": lower, "upper": upper, "lookback": lookback}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ratio", description="QQQ-TLT ratio strategy backtests and sweeps.")
+    parser.add_argument("command", choices=list(COMMANDS))
+    parser.add_argument("--ticker", default="QQQ")
+    parser.add_argument("--data", default=DATA, help="folder with <ticker>.csv and TLT.csv")
+    parser.add_argument("--period", type=int, default=3)
+    parser.add_argument("--lower", type=int, default=15)
+    parser.add_argument("--upper", type=int, default=70)
+    parser.add_argument("--lower-range", type=int, nargs=2, default=[5, 50], metavar=("START", "END"))
+    parser.add_argument("--upper-range", type=int, nargs=2, default=[55, 95], metavar=("START", "END"))
+    parser.add_argument("--lookback-range", type=int, nargs=2, default=[1, 20], metavar=("START", "END"))
+    add_output_args(parser)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    return run(COMMANDS, parse_args(argv), "ratio.plots")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from omega.results import file_digest
+
+CACHE_DIR = ".column_cache"
+
+def cache_dir(csv_path):
+    folder, name = os.path.split(csv_path)
+    return os.path.join(folder, CACHE_DIR, os.path.splitext(name)[0])
+
+def _replace(path, write):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+def _write_meta(directory, meta):
+    _replace(os.path.join(directory, "meta.json"), lambda f: f.write(json.dumps(meta).encode()))
+
+def _read_meta(directory):
+    try:
+        with open(os.path.join(directory, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _is_fresh(csv_path, directory, meta):
+    if meta is None:
+        return False
+    stat = os.stat(csv_path)
+    if meta["mtime_ns"] == stat.st_mtime_ns and meta["size"] == stat.st_size:
+        return True
+    # A touched but unchanged file (e.g. after a fresh checkout) keeps its
+    # cache; only the recorded mtime is refreshed.
+    if meta["size"] != stat.st_size or meta["sha1"] != file_digest(csv_path):
+        return False
+    meta["mtime_ns"] = stat.st_mtime_ns
+    try:
+        _write_meta(directory, meta)
+    except OSError:
+        pass
+    return True
+
+def read_csv_columns(csv_path):
+    df = pd.read_csv(csv_path)
+    df["Date"] = pd.to_datetime(df["Date"])
+    return {column: df[column].to_numpy() for column in df.columns}
+
+def build_cache(csv_path, directory):
+    stat = os.stat(csv_path)
+    columns = read_csv_columns(csv_path)
+    os.makedirs(directory, exist_ok=True)
+    for column, values in columns.items():
+        _replace(os.path.join(directory, f"{column}.npy"), lambda f: np.save(f, values))
+    # meta.json is written last, so a half-built cache is never seen as fresh
+    _write_meta(directory, {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha1": file_digest(csv_path),
+        "columns": list(columns),
+    })
+    return columns
+
+def load_columns(csv_path, columns=None):
+    # Columns of a yfinance-style CSV as memory-mapped arrays, converting the
+    # CSV to one .npy per column on first use. Falls back to parsing the CSV
+    # when the cache cannot be written.
+    directory = cache_dir(csv_path)
+    meta = _read_meta(directory)
+    if not _is_fresh(csv_path, directory, meta):
+        try:
+            parsed = build_cache(csv_path, directory)
+        except OSError:
+            parsed = read_csv_columns(csv_path)
+            return {column: parsed[column] for column in (columns or parsed)}
+        meta = _read_meta(directory)
+
+    names = columns or meta["columns"]
+    return {column: np.load(os.path.join(directory, f"{column}.npy"), mmap_mode="r") for column in names}
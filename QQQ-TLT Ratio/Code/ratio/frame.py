@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from omega.instrument import stage
+from ratio.prices import price_store
+from ratio.signals import rsi_signal
+
+def create_df(ticker="QQQ", folder_path="hist csv", period=3, lower_threshold=30, upper_threshold=70):
+    with stage("create_df.load"):
+        prices = price_store(folder_path).pair(ticker, "TLT")
+
+        ticker_column = f"{ticker}_Adj_Close"
+        combined_df = pd.DataFrame({
+            "Date": prices.dates,
+            ticker_column: prices.ticker_close,
+            "TLT_Adj_Close": prices.hedge_close,
+            "ratio": prices.ratio,
+        }, copy=False)
+
+    with stage("create_df.rsi"):
+        delta = combined_df["ratio"].diff()
+        gain = delta.where(delta > 0, 0)
+        loss = -delta.where(delta < 0, 0)
+
+        avg_gain = gain.rolling(window=period, min_periods=period).mean()
+        avg_loss = loss.rolling(window=period, min_periods=period).mean()
+
+        rs = avg_gain / avg_loss
+        combined_df["RSI"] = 100 - (100 / (1 + rs))
+
+    with stage("create_df.signal"):
+        combined_df["Signal"] = rsi_signal(combined_df["RSI"].to_numpy(), lower_threshold, upper_threshold)
+
+    with stage("create_df.returns"):
+        combined_df[f"{ticker} Ret"] = combined_df[ticker_column].pct_change()
+        combined_df[f"Cumul {ticker} Ret"] = (1 + combined_df[f"{ticker} Ret"]).cumprod() - 1
+
+        combined_df["Ret"] = combined_df[f"{ticker} Ret"] * combined_df["Signal"].shift(1)
+        combined_df["Cumul Ret"] = (1 + combined_df["Ret"]).cumprod() - 1
+
+    return combined_df
+
+def sharpe_ratio(returns):
+    return np.sqrt(252) * returns.mean() / returns.std()
+
+def num_trades(df):
+    # A trade is a buy: previous day signal 0, current day signal 1
+    return int(((df["Signal"] == 1) & (df["Signal"].shift(1) == 0)).sum())
+
+def add_drawdowns(df, ticker):
+    df["CumTotalDD"] = ((df["Cumul Ret"] + 1) - (df["Cumul Ret"] + 1).cummax()) / (df["Cumul Ret"] + 1).cummax()
+    df[f"Cum{ticker}DD"] = ((df[f"Cumul {ticker} Ret"] + 1) - (df[f"Cumul {ticker} Ret"] + 1).cummax()) / (df[f"Cumul {ticker} Ret"] + 1).cummax()
+    return df
+
+def backtest_summary(df, ticker):
+    return {
+        "Sharpe Ratio": float(sharpe_ratio(df["Ret"])),
+        f"{ticker} Sharpe Ratio": float(sharpe_ratio(df[f"{ticker} Ret"])),
+        "Cumul Ret": float(df["Cumul Ret"].iloc[-1]),
+        f"Cumul {ticker} Ret": float(df[f"Cumul {ticker} Ret"].iloc[-1]),
+        "Trades": num_trades(df),
+    }
@@ -0,0 +1,44 @@
+import numpy as np
+
+from omega.instrument import stage
+from ratio.signals import grid_signal, rsi_lookbacks, rsi_signal
+from ratio.stats import masked_stats, return_features
+
+def pct_change(close):
+    ret = np.empty_like(close)
+    ret[..., 0] = np.nan
+    ret[..., 1:] = close[..., 1:] / close[..., :-1] - 1
+    return ret
+
+def metric_block(rsi_values, returns, lower_thresholds, upper_thresholds, metric="Sharpe Ratio", features=None):
+    if features is None:
+        features = return_features(returns)
+    with stage("grid.signal"):
+        signals = grid_signal(rsi_values, lower_thresholds, upper_thresholds)
+    with stage("grid.metric"):
+        block = np.empty((len(lower_thresholds), len(upper_thresholds)))
+        for i in range(len(lower_thresholds)):
+            block[i] = masked_stats(signals[i], returns, features)[metric]
+    return block
+
+def metric_cube(prices, periods, lower_thresholds, upper_thresholds, metric="Sharpe Ratio"):
+    returns = pct_change(prices.ticker_close)
+    features = return_features(returns)
+    cube = np.empty((len(periods), len(lower_thresholds), len(upper_thresholds)))
+    for k, rsi_values in enumerate(rsi_lookbacks(prices.ratio, periods)):
+        cube[k] = metric_block(rsi_values, returns, lower_thresholds, upper_thresholds, metric, features)
+    return cube
+
+def lookback_metrics(prices, periods, lower_threshold, upper_threshold, metric="Sharpe Ratio"):
+    # One metric per lookback period for a fixed threshold pair. The RSI of
+    # every period is built in one pass and the signals and statistics are
+    # vectorized over the period axis, so hundreds of periods cost about as
+    # much as a handful.
+    returns = pct_change(prices.ticker_close)
+    features = return_features(returns)
+    with stage("grid.rsi"):
+        rsi_values = rsi_lookbacks(prices.ratio, periods)
+    with stage("grid.signal"):
+        signals = rsi_signal(rsi_values, lower_threshold, upper_threshold)
+    with stage("grid.metric"):
+        return masked_stats(signals, returns, features)[metric]
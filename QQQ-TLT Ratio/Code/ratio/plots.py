@@ -0,0 +1,59 @@
+# Figure builders for the strategy scripts and the CLI. matplotlib and
+# seaborn are imported on first use, so importing ratio never pays for them.
+# Builders return the Figure; scripts call show(), the CLI saves to files.
+
+def pyplot():
+    import matplotlib.pyplot as plt
+    return plt
+
+def show():
+    pyplot().show()
+
+def heatmap_figure(sharpe_matrix, ticker, period):
+    import seaborn as sns
+    plt = pyplot()
+    fig = plt.figure(figsize=(12, 8))
+    sns.heatmap(sharpe_matrix, annot=False, fmt=".2f", cmap="coolwarm", cbar_kws={'label': 'Sharpe Ratio'})
+    plt.title(f"Sharpe Ratios for {ticker} Across Threshold Combinations \n Lookback Period: {period}")
+    plt.xlabel("Upper Threshold")
+    plt.ylabel("Lower Threshold")
+    plt.xticks(rotation=45)
+    return fig
+
+def sweep_figure(result_df, parameter, title, xticks=None):
+    # Bar chart of a one-parameter Sharpe sweep (L Opt, U Opt, LB Opt)
+    plt = pyplot()
+    fig = plt.figure(figsize=(14, 7))
+    plt.bar(result_df[parameter], result_df["Sharpe Ratio"], color="blue")
+    plt.xlabel(parameter)
+    plt.ylabel("Sharpe Ratio")
+    plt.title(title)
+    if xticks is not None:
+        plt.xticks(xticks)
+    plt.yticks()
+    return fig
+
+def returns_figure(df, ticker):
+    plt = pyplot()
+    fig = plt.figure(figsize=(14, 7))
+    plt.plot(df["Date"], df["Cumul Ret"], label=f"Strategy", color="blue")
+    plt.plot(df["Date"], df[f"Cumul {ticker} Ret"], label=ticker, color="orange")
+    plt.title(f"Cumulative Returns: Strategy vs {ticker}")
+    plt.xlabel("Date")
+    plt.ylabel("Cumulative Return")
+    plt.legend()
+    plt.grid(True)
+    return fig
+
+def drawdown_figure(df, ticker):
+    # Expects the columns added by ratio.frame.add_drawdowns
+    plt = pyplot()
+    fig = plt.figure(figsize=(14, 7))
+    plt.plot(df["Date"], df["CumTotalDD"], label="Strategy ", color="blue")
+    plt.plot(df["Date"], df[f"Cum{ticker}DD"], label=f"{ticker}", color="orange")
+    plt.title(f"Cumulative Drawdowns: Strategy vs {ticker}")
+    plt.xlabel("Date")
+    plt.ylabel("Cumulative Drawdown")
+    plt.legend()
+    plt.grid(True)
+    return fig
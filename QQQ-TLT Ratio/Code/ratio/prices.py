@@ -0,0 +1,100 @@
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from ratio.columns import load_columns
+from omega.instrument import stage
+
+PricePair = namedtuple("PricePair", ["ticker", "hedge", "dates", "ticker_close", "hedge_close", "ratio"])
+PricePanel = namedtuple("PricePanel", ["tickers", "dates", "closes"])
+
+def frozen(values):
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+class PriceStore:
+    # Reads each ticker once and keeps aligned pairs as read-only float64
+    # arrays, so repeated create_df calls and sweeps share the same memory.
+    # A ticker is read again once its CSV's mtime or size changes (a bar was
+    # appended, say), along with every pair and panel that used it.
+    def __init__(self, folder_path="hist csv", use_cache=True):
+        self.folder_path = folder_path
+        self.use_cache = use_cache
+        self._closes = {}
+        self._pairs = {}
+        self._panels = {}
+
+    def closes(self, ticker):
+        file_path = os.path.join(self.folder_path, f"{ticker}.csv")
+        stat = os.stat(file_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if ticker not in self._closes or self._closes[ticker][0] != stamp:
+            self.invalidate(ticker)
+            with stage("prices.read"):
+                if self.use_cache:
+                    data = pd.DataFrame(load_columns(file_path, ["Date", "Adj Close"]), copy=False)
+                else:
+                    data = pd.read_csv(file_path, usecols=["Date", "Adj Close"])
+            self._closes[ticker] = (stamp, data)
+        return self._closes[ticker][1]
+
+    def invalidate(self, *tickers):
+        # Drops the given tickers (every ticker when none are given) so the
+        # next call reads them from disk.
+        if not tickers:
+            tickers = list(self._closes)
+        for ticker in tickers:
+            self._closes.pop(ticker, None)
+            for cache in (self._pairs, self._panels):
+                for key in [key for key in cache if ticker in key]:
+                    del cache[key]
+
+    def pair(self, ticker, hedge="TLT"):
+        # Revalidating both closes first drops a stale pair
+        ticker_data = self.closes(ticker)
+        hedge_data = self.closes(hedge)
+        key = (ticker, hedge)
+        if key not in self._pairs:
+            ticker_data = ticker_data.rename(columns={"Adj Close": "ticker"})
+            hedge_data = hedge_data.rename(columns={"Adj Close": "hedge"})
+
+            with stage("prices.merge"):
+                merged = pd.merge(ticker_data, hedge_data, on="Date")
+                merged["Date"] = pd.to_datetime(merged["Date"])
+                merged = merged.sort_values(by="Date", kind="stable")
+
+            ticker_close = frozen(merged["ticker"])
+            hedge_close = frozen(merged["hedge"])
+            dates = merged["Date"].to_numpy()
+            dates.flags.writeable = False
+            self._pairs[key] = PricePair(ticker, hedge, dates, ticker_close, hedge_close, frozen(ticker_close / hedge_close))
+        return self._pairs[key]
+
+    def tickers(self):
+        return sorted(name[:-4] for name in os.listdir(self.folder_path) if name.endswith(".csv"))
+
+    def panel(self, tickers):
+        # Closes of every ticker on the dates they all share, one row per
+        # ticker in a single (n_tickers, n_bars) array.
+        key = tuple(tickers)
+        closes = [self.closes(ticker) for ticker in key]
+        if key not in self._panels:
+            merged = None
+            for ticker, data in zip(key, closes):
+                data = data.rename(columns={"Adj Close": ticker})
+                merged = data if merged is None else pd.merge(merged, data, on="Date")
+            merged["Date"] = pd.to_datetime(merged["Date"])
+            merged = merged.sort_values(by="Date", kind="stable")
+
+            dates = merged["Date"].to_numpy()
+            dates.flags.writeable = False
+            self._panels[key] = PricePanel(key, dates, frozen(merged[list(key)].to_numpy().T))
+        return self._panels[key]
+
+@lru_cache(maxsize=None)
+def price_store(folder_path="hist csv", use_cache=True):
+    return PriceStore(folder_path, use_cache)
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+def rsi(ratio, period=3):
+    # Accepts one series or a stack of series with bars on the last axis.
+    ratio = np.asarray(ratio, dtype=float)
+    delta = pd.DataFrame(ratio.reshape(-1, ratio.shape[-1]).T).diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    avg_gain = gain.rolling(window=period, min_periods=period).mean()
+    avg_loss = loss.rolling(window=period, min_periods=period).mean()
+
+    rs = avg_gain / avg_loss
+    return (100 - (100 / (1 + rs))).to_numpy().T.reshape(ratio.shape)
+
+def _two_sum(a, b):
+    # a + b as a rounded sum s and its exact rounding error
+    s = a + b
+    b_part = s - a
+    return s, (a - (s - b_part)) + (b - b_part)
+
+def window_sums(values, periods):
+    # Trailing sums over every period at once, (n_periods, n_bars), as
+    # differences of one prefix sum. NaN until a full window is available.
+    # The prefix sum is carried as hi + lo with the rounding error of each
+    # step kept in lo, so a difference comes out as the correctly rounded
+    # window sum, the same value as math.fsum and the rolling mean, and ties
+    # between gains and losses stay ties.
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    hi = [0.0] * (n + 1)
+    lo = [0.0] * (n + 1)
+    for i, value in enumerate(values.tolist()):
+        hi[i + 1], err = _two_sum(hi[i], value)
+        lo[i + 1] = lo[i] + err
+    hi = np.array(hi)
+    lo = np.array(lo)
+
+    ends = np.arange(1, n + 1)
+    starts = np.maximum(ends[None, :] - periods[:, None], 0)
+    head, tail = _two_sum(hi[ends][None, :], -hi[starts])
+    sums = head + (tail + (lo[ends][None, :] - lo[starts]))
+    return np.where(ends[None, :] - periods[:, None] >= 0, sums, np.nan)
+
+def rsi_lookbacks(ratio, periods):
+    # rsi() of one series for many periods in a single pass, one row per
+    # period. Gains and losses are prefix-summed once; exact window sums give
+    # flat stretches the same 0, 100 and NaN values as the rolling mean.
+    ratio = np.asarray(ratio, dtype=float)
+    periods = np.asarray(periods, dtype=np.int64)
+    delta = np.diff(ratio, prepend=np.nan)
+
+    avg_gain = window_sums(np.where(delta > 0, delta, 0), periods) / periods[:, None]
+    avg_loss = window_sums(np.where(delta < 0, -delta, 0), periods) / periods[:, None]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+def crossings(rsi, lower_threshold, upper_threshold):
+    rsi = np.asarray(rsi, dtype=float)
+    prev = rsi[..., :-1]
+    curr = rsi[..., 1:]
+    enters = (prev > lower_threshold) & (curr <= lower_threshold)
+    exits = (prev < upper_threshold) & (curr >= upper_threshold)
+    return enters, exits
+
+def last_event(events):
+    idx = np.arange(events.shape[-1])
+    return np.maximum.accumulate(np.where(events, idx, -1), axis=-1)
+
+def latch(enters, exits):
+    # Active while the most recent enter is newer than the most recent exit.
+    # Only valid when no bar is both an enter and an exit.
+    return last_event(enters) > last_event(exits)
+
+def scan(enters, exits):
+    # Sequential state machine, vectorized across every leading axis.
+    # Needed when lower >= upper lets a bar both enter and exit.
+    active = np.zeros(enters.shape[:-1], dtype=bool)
+    out = np.empty(enters.shape, dtype=bool)
+    for i in range(enters.shape[-1]):
+        active = np.where(active, ~exits[..., i], enters[..., i])
+        out[..., i] = active
+    return out
+
+def rsi_signal(rsi, lower_threshold=30, upper_threshold=70):
+    enters, exits = crossings(rsi, lower_threshold, upper_threshold)
+    if np.any(enters & exits):
+        active = scan(enters, exits)
+    else:
+        active = latch(enters, exits)
+    signal = np.zeros(active.shape[:-1] + (np.shape(rsi)[-1],), dtype=np.int64)
+    signal[..., 1:] = active
+    return signal
+
+def grid_signal(rsi, lower_thresholds, upper_thresholds):
+    # Boolean signals of shape (n_lower, n_upper, n_bars). Enter crossings
+    # depend only on the lower threshold and exits only on the upper one, so
+    # each is computed once per threshold and the pairs are a broadcast.
+    lowers = np.asarray(lower_thresholds, dtype=float)
+    uppers = np.asarray(upper_thresholds, dtype=float)
+    enters, _ = crossings(rsi, lowers[:, None], np.inf)
+    _, exits = crossings(rsi, -np.inf, uppers[:, None])
+
+    active = np.zeros((len(lowers), len(uppers), np.shape(rsi)[-1]), dtype=bool)
+    active[..., 1:] = last_event(enters)[:, None, :] > last_event(exits)[None, :, :]
+    for i, j in zip(*np.nonzero(lowers[:, None] >= uppers[None, :])):
+        if np.any(enters[i] & exits[j]):
+            active[i, j, 1:] = scan(enters[i], exits[j])
+    return active
@@ -0,0 +1,61 @@
+import numpy as np
+
+def sharpe_from_sums(total, total_sq, count):
+    # Annualized Sharpe with the sample (ddof=1) std that pandas uses.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        var = (total_sq - total * mean) / (count - 1)
+        return np.sqrt(252) * mean / np.sqrt(var)
+
+def return_features(returns):
+    # Per-bar columns whose masked sums give every statistic below. Bar 0 has
+    # no return, so features start at bar 1.
+    r = returns[..., 1:]
+    neg = r < 0
+    return np.stack([
+        r,
+        r * r,
+        np.where(neg, r, 0),
+        np.where(neg, r * r, 0),
+        neg,
+        r > 0,
+        np.log1p(r),
+        np.ones_like(r),
+    ], axis=-1).astype(np.float64)
+
+def masked_sums(signals, returns, features=None):
+    # Strategy return on bar i is returns[i] * signals[i - 1], the "Ret"
+    # column of create_df. Since the mask is 0/1, any per-bar function of the
+    # strategy return is a masked sum of the same function of returns.
+    if features is None:
+        features = return_features(returns)
+    held = signals[..., :-1].astype(np.float64)
+    if features.ndim == 2:
+        return held @ features
+    return np.einsum("...i,...ik->...k", held, features)
+
+def masked_stats(signals, returns, features=None):
+    signals = np.asarray(signals)
+    sums = masked_sums(signals, returns, features)
+    total, total_sq, neg_total, neg_sq, neg_days, pos_days, log_growth, days_held = np.moveaxis(sums, -1, 0)
+    active = signals.astype(bool)
+    count = signals.shape[-1] - 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        neg_mean = neg_total / neg_days
+        downside_dev = np.sqrt(neg_sq / neg_days - neg_mean * neg_mean)
+        return {
+            "Sharpe Ratio": sharpe_from_sums(total, total_sq, count),
+            "Sortino Ratio": np.sqrt(252) * (total / count) / downside_dev,
+            "Hit Rate": pos_days / days_held,
+            "Exposure": days_held / count,
+            "Trades": np.count_nonzero(active[..., 1:] > active[..., :-1], axis=-1),
+            "Cumul Ret": np.expm1(log_growth),
+        }
+
+def masked_sharpe(signals, returns):
+    held = signals[..., :-1].astype(np.float64)
+    r = returns[..., 1:]
+    total = np.einsum("...i,...i->...", held, r)
+    total_sq = np.einsum("...i,...i->...", held, r * r)
+    return sharpe_from_sums(total, total_sq, r.shape[-1])
@@ -0,0 +1,91 @@
+import math
+from collections import deque
+
+from ratio.prices import price_store
+
+class RatioStream:
+    # Incremental version of create_df for live daily bars. Each update costs
+    # O(period) regardless of how much history has been seen, and emits the
+    # same values as the matching create_df row.
+    def __init__(self, ticker="QQQ", period=3, lower_threshold=30, upper_threshold=70):
+        self.ticker = ticker
+        self.period = period
+        self.lower_threshold = lower_threshold
+        self.upper_threshold = upper_threshold
+
+        self.gains = deque(maxlen=period)
+        self.losses = deque(maxlen=period)
+        self.last_date = None
+        self.last_close = None
+        self.last_ratio = None
+        self.last_rsi = math.nan
+        self.signal_active = False
+        self.signal = 0
+        self.ticker_growth = math.nan
+        self.growth = math.nan
+
+    @classmethod
+    def from_csv(cls, ticker="QQQ", folder_path="hist csv", period=3, lower_threshold=30, upper_threshold=70):
+        prices = price_store(folder_path).pair(ticker, "TLT")
+        stream = cls(ticker, period, lower_threshold, upper_threshold)
+        stream.replay(prices.dates, prices.ticker_close, prices.hedge_close)
+        return stream
+
+    def replay(self, dates, ticker_closes, hedge_closes):
+        row = None
+        for date, ticker_close, hedge_close in zip(dates, ticker_closes, hedge_closes):
+            row = self.update(date, ticker_close, hedge_close)
+        return row
+
+    def update(self, date, ticker_close, hedge_close):
+        if self.last_date is not None and date <= self.last_date:
+            raise ValueError(f"Bar dated {date} is not after the last bar ({self.last_date}).")
+        ticker_close = float(ticker_close)
+        ratio = ticker_close / float(hedge_close)
+
+        if self.last_ratio is None:
+            # create_df's first delta is NaN, which the gain/loss masks turn into 0
+            delta = 0.0
+            ticker_ret = math.nan
+            ret = math.nan
+        else:
+            delta = ratio - self.last_ratio
+            ticker_ret = ticker_close / self.last_close - 1
+            ret = ticker_ret * self.signal
+            self.ticker_growth = (1 + ticker_ret) if math.isnan(self.ticker_growth) else self.ticker_growth * (1 + ticker_ret)
+            self.growth = (1 + ret) if math.isnan(self.growth) else self.growth * (1 + ret)
+        self.gains.append(delta if delta > 0 else 0.0)
+        self.losses.append(-delta if delta < 0 else 0.0)
+
+        rsi = self._rsi()
+        if not self.signal_active and self.last_rsi > self.lower_threshold and rsi <= self.lower_threshold:
+            self.signal_active = True
+        elif self.signal_active and self.last_rsi < self.upper_threshold and rsi >= self.upper_threshold:
+            self.signal_active = False
+        self.signal = int(self.signal_active)
+
+        self.last_date = date
+        self.last_close = ticker_close
+        self.last_ratio = ratio
+        self.last_rsi = rsi
+
+        return {
+            "Date": date,
+            "ratio": ratio,
+            "RSI": rsi,
+            "Signal": self.signal,
+            f"{self.ticker} Ret": ticker_ret,
+            f"Cumul {self.ticker} Ret": self.ticker_growth - 1,
+            "Ret": ret,
+            "Cumul Ret": self.growth - 1,
+        }
+
+    def _rsi(self):
+        if len(self.gains) < self.period:
+            return math.nan
+        # fsum is exactly rounded, which reproduces pandas' compensated rolling mean
+        avg_gain = math.fsum(self.gains) / self.period
+        avg_loss = math.fsum(self.losses) / self.period
+        if avg_loss == 0:
+            return math.nan if avg_gain == 0 else 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
@@ -0,0 +1,136 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from ratio.grid import lookback_metrics, metric_block, pct_change
+from omega.instrument import stage
+from ratio.prices import PriceStore, price_store
+from omega.results import cached
+from ratio.signals import rsi_lookbacks
+from ratio.stats import return_features
+
+# Per-process state for pool workers: the attached shared block and a cache
+# of return features and the RSI of every period, built once per worker.
+_worker = {}
+
+def rsi_cache(ratio, periods):
+    with stage("sweep.rsi"):
+        return dict(zip(periods, rsi_lookbacks(ratio, periods)))
+
+def _attach(shm_name, shape, periods):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["arrays"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _worker["cache"] = rsi_cache(_worker["arrays"][1], periods)
+
+def _evaluate(arrays, cache, task):
+    k, start, period, lower_thresholds, upper_thresholds, metric = task
+    returns = arrays[0]
+    if "features" not in cache:
+        with stage("sweep.features"):
+            cache["features"] = return_features(returns)
+    return k, start, metric_block(cache[period], returns, lower_thresholds, upper_thresholds, metric, cache["features"])
+
+def _run_task(task):
+    return _evaluate(_worker["arrays"], _worker["cache"], task)
+
+def sweep_tasks(periods, lower_thresholds, upper_thresholds, metric="Sharpe Ratio", chunk_size=8):
+    tasks = []
+    for k, period in enumerate(periods):
+        for start in range(0, len(lower_thresholds), chunk_size):
+            tasks.append((k, start, period, lower_thresholds[start:start + chunk_size], upper_thresholds, metric))
+    return tasks
+
+def sweep_cube(prices, periods, lower_thresholds, upper_thresholds, workers=1, chunk_size=8, metric="Sharpe Ratio"):
+    # One ratio.stats metric (Sharpe by default) of shape (n_periods,
+    # n_lower, n_upper). Every cell is computed independently of how the grid
+    # is chunked, so the result is identical for any worker count.
+    # workers=None uses every core.
+    periods = list(periods)
+    lower_thresholds = list(lower_thresholds)
+    upper_thresholds = list(upper_thresholds)
+    workers = workers or os.cpu_count()
+
+    arrays = np.stack([pct_change(prices.ticker_close), prices.ratio])
+    tasks = sweep_tasks(periods, lower_thresholds, upper_thresholds, metric, chunk_size)
+    cube = np.empty((len(periods), len(lower_thresholds), len(upper_thresholds)))
+
+    if workers == 1:
+        cache = rsi_cache(prices.ratio, periods)
+        results = (_evaluate(arrays, cache, task) for task in tasks)
+        for k, start, block in results:
+            cube[k, start:start + len(block)] = block
+        return cube
+
+    shm = shared_memory.SharedMemory(create=True, size=arrays.nbytes)
+    try:
+        np.ndarray(arrays.shape, dtype=np.float64, buffer=shm.buf)[:] = arrays
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(shm.name, arrays.shape, periods)) as pool:
+            for k, start, block in pool.map(_run_task, tasks):
+                cube[k, start:start + len(block)] = block
+    finally:
+        shm.close()
+        shm.unlink()
+    return cube
+
+def price_files(folder_path, ticker):
+    return [os.path.join(folder_path, f"{name}.csv") for name in (ticker, "TLT")]
+
+def cached_sweep(name, folder_path, ticker, params, compute, use_cache=True):
+    # compute(prices) for the ticker/TLT pair. Sweeps are keyed on the price
+    # files and their grid, not on workers, since every worker count gives
+    # the same result.
+    if not use_cache:
+        return compute(price_store(folder_path).pair(ticker, "TLT"))
+
+    def compute_from_files():
+        # A miss reads the files that were just hashed straight from the CSVs:
+        # price_store and the column cache only check mtime and size, and
+        # must not hand back older prices to be stored under the new key.
+        return compute(PriceStore(folder_path, use_cache=False).pair(ticker, "TLT"))
+
+    return cached(name, price_files(folder_path, ticker), dict(params, ticker=ticker), compute_from_files)
+
+def sharpe_matrix(ticker="QQQ", folder_path="hist csv", period=3, lower_thresholds=range(5, 51), upper_thresholds=range(55, 96), workers=1, use_cache=True):
+    lower_thresholds = list(lower_thresholds)
+    upper_thresholds = list(upper_thresholds)
+
+    def compute(prices):
+        cube = sweep_cube(prices, [period], lower_thresholds, upper_thresholds, workers)
+        return pd.DataFrame(cube[0], index=lower_thresholds, columns=upper_thresholds)
+
+    params = {"period": period, "lower_thresholds": lower_thresholds, "upper_thresholds": upper_thresholds}
+    return cached_sweep("sharpe_matrix", folder_path, ticker, params, compute, use_cache)
+
+def lower_threshold_sharpes(ticker="QQQ", folder_path="hist csv", period=3, lower_start=5, lower_end=50, upper_threshold=70, workers=1, use_cache=True):
+    lower_thresholds = list(range(lower_start, lower_end + 1))
+
+    def compute(prices):
+        sharpes = sweep_cube(prices, [period], lower_thresholds, [upper_threshold], workers)
+        return pd.DataFrame({"Lower Threshold": lower_thresholds, "Sharpe Ratio": sharpes[0, :, 0]})
+
+    params = {"period": period, "lower_thresholds": lower_thresholds, "upper_threshold": upper_threshold}
+    return cached_sweep("lower_threshold_sharpes", folder_path, ticker, params, compute, use_cache)
+
+def upper_threshold_sharpes(ticker="QQQ", folder_path="hist csv", period=3, lower_threshold=15, upper_start=60, upper_end=95, workers=1, use_cache=True):
+    upper_thresholds = list(range(upper_start, upper_end + 1))
+
+    def compute(prices):
+        sharpes = sweep_cube(prices, [period], [lower_threshold], upper_thresholds, workers)
+        return pd.DataFrame({"Upper Threshold": upper_thresholds, "Sharpe Ratio": sharpes[0, 0, :]})
+
+    params = {"period": period, "lower_threshold": lower_threshold, "upper_thresholds": upper_thresholds}
+    return cached_sweep("upper_threshold_sharpes", folder_path, ticker, params, compute, use_cache)
+
+def lookback_sharpes(ticker="QQQ", folder_path="hist csv", lower_threshold=15, upper_threshold=70, lb_start=1, lb_end=20, use_cache=True):
+    periods = list(range(lb_start, lb_end + 1))
+
+    def compute(prices):
+        sharpes = lookback_metrics(prices, periods, lower_threshold, upper_threshold)
+        return pd.DataFrame({"Lookback Period": periods, "Sharpe Ratio": sharpes})
+
+    params = {"periods": periods, "lower_threshold": lower_threshold, "upper_threshold": upper_threshold}
+    return cached_sweep("lookback_sharpes", folder_path, ticker, params, compute, use_cache)
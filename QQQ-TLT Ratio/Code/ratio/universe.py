@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from ratio.grid import pct_change
+from ratio.prices import price_store
+from ratio.signals import rsi, rsi_signal
+from ratio.stats import masked_sharpe, masked_stats
+
+def ratio_pairs(numerators, denominators):
+    return [(ticker, hedge) for ticker in numerators for hedge in denominators if ticker != hedge]
+
+def universe_backtest(numerators=None, denominators=None, folder_path="hist csv", period=3, lower_threshold=15, upper_threshold=70):
+    # Every numerator/denominator pair on one common date index. Ratios, RSI,
+    # signals and returns are (n_pairs, n_bars) arrays, and each row trades
+    # its numerator exactly as create_df does. numerators and denominators
+    # default to every ticker in folder_path.
+    if numerators is None or denominators is None:
+        every_ticker = price_store(folder_path).tickers()
+        numerators = every_ticker if numerators is None else numerators
+        denominators = every_ticker if denominators is None else denominators
+    pairs = ratio_pairs(numerators, denominators)
+    tickers = list(dict.fromkeys(ticker for pair in pairs for ticker in pair))
+    panel = price_store(folder_path).panel(tickers)
+
+    numerator_idx = [tickers.index(ticker) for ticker, _ in pairs]
+    denominator_idx = [tickers.index(hedge) for _, hedge in pairs]
+
+    ratio = panel.closes[numerator_idx] / panel.closes[denominator_idx]
+    signal = rsi_signal(rsi(ratio, period), lower_threshold, upper_threshold)
+    ticker_ret = pct_change(panel.closes)[numerator_idx]
+    return pairs, panel.dates, signal, ticker_ret
+
+def universe_summary(numerators=None, denominators=None, folder_path="hist csv", period=3, lower_threshold=15, upper_threshold=70):
+    pairs, dates, signal, ticker_ret = universe_backtest(numerators, denominators, folder_path, period, lower_threshold, upper_threshold)
+
+    summary = pd.DataFrame({
+        "Ticker": [ticker for ticker, _ in pairs],
+        "Hedge": [hedge for _, hedge in pairs],
+    })
+    for name, values in masked_stats(signal, ticker_ret).items():
+        summary[name] = values
+    summary["Ticker Sharpe Ratio"] = masked_sharpe(np.ones_like(signal), ticker_ret)
+    summary["Cumul Ticker Ret"] = np.prod(1 + ticker_ret[:, 1:], axis=-1) - 1
+    return summary
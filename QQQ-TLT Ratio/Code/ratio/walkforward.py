@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from ratio.grid import pct_change
+from ratio.prices import price_store
+from ratio.signals import grid_signal, rsi_lookbacks, rsi_signal
+from ratio.stats import sharpe_from_sums
+
+def fold_bounds(n_bars, folds=20, train_bars=1260, anchored=False):
+    # (train_start, test_start, test_end) bar indices for each fold. Test
+    # windows tile everything after the first training window; training
+    # windows either roll with them or are anchored at the first return.
+    test_bars = (n_bars - train_bars) // folds
+    if test_bars < 2:
+        raise ValueError("Not enough bars for the requested folds and training window.")
+
+    bounds = []
+    for fold in range(folds):
+        test_start = train_bars + fold * test_bars
+        test_end = n_bars if fold == folds - 1 else test_start + test_bars
+        train_start = 1 if anchored else max(1, test_start - train_bars)
+        bounds.append((train_start, test_start, test_end))
+    return bounds
+
+def window_weights(returns, bounds):
+    # Daily returns (and their squares) masked to each training window, one
+    # column per fold. A signal matrix times these gives every window's
+    # masked sums in a single product, however much the windows overlap.
+    weights = np.zeros((len(returns) - 1, len(bounds)))
+    for fold, (train_start, test_start, _) in enumerate(bounds):
+        weights[train_start - 1:test_start - 1, fold] = 1
+    r = returns[1:, None]
+    return r * weights, r * r * weights, weights.sum(axis=0)
+
+def in_sample_sharpes(rsi_cache, returns, bounds, periods, lower_thresholds, upper_thresholds):
+    weighted, weighted_sq, count = window_weights(returns, bounds)
+
+    sharpes = np.empty((len(bounds), len(periods), len(lower_thresholds), len(upper_thresholds)))
+    for k, period in enumerate(periods):
+        signals = grid_signal(rsi_cache[period], lower_thresholds, upper_thresholds)
+        for i in range(len(lower_thresholds)):
+            held = signals[i, :, :-1].astype(np.float64)
+            sharpes[:, k, i] = sharpe_from_sums(held @ weighted, held @ weighted_sq, count).T
+    return sharpes
+
+def walk_forward(ticker="QQQ", folder_path="hist csv", periods=range(1, 21), lower_thresholds=range(5, 51), upper_thresholds=range(55, 96), folds=20, train_bars=1260, anchored=False):
+    periods = list(periods)
+    lower_thresholds = list(lower_thresholds)
+    upper_thresholds = list(upper_thresholds)
+
+    prices = price_store(folder_path).pair(ticker, "TLT")
+    returns = pct_change(prices.ticker_close)
+    bounds = fold_bounds(len(returns), folds, train_bars, anchored)
+
+    # RSI is causal, so one pass over the full history serves every window.
+    rsi_cache = dict(zip(periods, rsi_lookbacks(prices.ratio, periods)))
+    sharpes = in_sample_sharpes(rsi_cache, returns, bounds, periods, lower_thresholds, upper_thresholds)
+
+    fold_rows = []
+    oos_parts = []
+    for fold, (train_start, test_start, test_end) in enumerate(bounds):
+        k, i, j = np.unravel_index(np.argmax(np.nan_to_num(sharpes[fold], nan=-np.inf)), sharpes[fold].shape)
+        period, lower_threshold, upper_threshold = periods[k], lower_thresholds[i], upper_thresholds[j]
+
+        signal = rsi_signal(rsi_cache[period], lower_threshold, upper_threshold)
+        ret = returns[test_start:test_end] * signal[test_start - 1:test_end - 1]
+        oos_sharpe = sharpe_from_sums(ret.sum(), (ret * ret).sum(), len(ret))
+
+        fold_rows.append({
+            "Fold": fold,
+            "Train Start": prices.dates[train_start],
+            "Train End": prices.dates[test_start - 1],
+            "Test Start": prices.dates[test_start],
+            "Test End": prices.dates[test_end - 1],
+            "Lookback Period": period,
+            "Lower Threshold": lower_threshold,
+            "Upper Threshold": upper_threshold,
+            "IS Sharpe": sharpes[fold, k, i, j],
+            "OOS Sharpe": oos_sharpe,
+        })
+        oos_parts.append(pd.DataFrame({"Date": prices.dates[test_start:test_end], "Fold": fold, "Ret": ret}))
+
+    oos_df = pd.concat(oos_parts, ignore_index=True)
+    oos_df["Cumul Ret"] = (1 + oos_df["Ret"]).cumprod() - 1
+    return pd.DataFrame(fold_rows), oos_df
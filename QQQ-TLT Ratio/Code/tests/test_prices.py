@@ -0,0 +1,49 @@
+import os
+import shutil
+
+import numpy as np
+
+from ratio.frame import create_df
+from ratio.prices import price_store
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+def copy_data(tmp_path, drop_last=0):
+    # QQQ and TLT with the last drop_last bars of QQQ held back
+    folder = tmp_path / "Data"
+    folder.mkdir()
+    shutil.copy(os.path.join(DATA, "TLT.csv"), folder / "TLT.csv")
+    with open(os.path.join(DATA, "QQQ.csv")) as f:
+        lines = f.readlines()
+    (folder / "QQQ.csv").write_text("".join(lines[:len(lines) - drop_last]))
+    return str(folder), lines[len(lines) - drop_last:]
+
+def test_appended_bar_is_read_in_the_same_process(tmp_path):
+    folder, held_back = copy_data(tmp_path, drop_last=1)
+    store = price_store(folder)
+    before = store.pair("QQQ", "TLT")
+    n_before = len(create_df("QQQ", folder, 3, 15, 70))
+
+    with open(os.path.join(folder, "QQQ.csv"), "a") as f:
+        f.writelines(held_back)
+    after = store.pair("QQQ", "TLT")
+    full = price_store(DATA).pair("QQQ", "TLT")
+
+    assert len(after.dates) == len(before.dates) + 1
+    np.testing.assert_array_equal(after.ratio, full.ratio)
+    np.testing.assert_array_equal(after.dates, full.dates)
+    assert len(create_df("QQQ", folder, 3, 15, 70)) == n_before + 1
+
+def test_unchanged_files_are_not_read_again(tmp_path):
+    folder, _ = copy_data(tmp_path)
+    store = price_store(folder)
+    assert store.pair("QQQ", "TLT") is store.pair("QQQ", "TLT")
+
+def test_invalidate_drops_pairs(tmp_path):
+    folder, _ = copy_data(tmp_path)
+    store = price_store(folder)
+    first = store.pair("QQQ", "TLT")
+    store.invalidate("TLT")
+    second = store.pair("QQQ", "TLT")
+    assert second is not first
+    np.testing.assert_array_equal(second.ratio, first.ratio)
@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Importing ratio puts the repository root, and omega, on sys.path
+import ratio
+from omega import results
+
+Metrics = namedtuple("Metrics", ["final", "ruin"])
+
+def assert_same(got, want):
+    assert type(got) is type(want)
+    if isinstance(want, np.ndarray):
+        assert got.dtype == want.dtype
+        np.testing.assert_array_equal(got, want)
+    elif isinstance(want, pd.DataFrame):
+        pd.testing.assert_frame_equal(got, want)
+    elif isinstance(want, (tuple, list)):
+        assert len(got) == len(want)
+        for g, w in zip(got, want):
+            assert_same(g, w)
+    elif isinstance(want, dict):
+        assert list(got) == list(want)
+        for key in want:
+            assert_same(got[key], want[key])
+    elif isinstance(want, np.generic):
+        assert got.dtype == want.dtype
+        assert got == want or (np.isnan(got) and np.isnan(want))
+    else:
+        assert got == want
+
+VALUE = (
+    np.arange(6, dtype=np.float32).reshape(2, 3),
+    [np.float64(0.1) + np.float64(0.2), np.int32(-7), np.bool_(True), np.float64(np.nan)],
+    {"frame": pd.DataFrame({"a": [1.5, 2.5], "b": [1, 2]}, index=[3, 4]), "ratio": 1 / 3, "n": 5, "name": "x", "none": None},
+    Metrics(np.zeros(2), np.int64(3)),
+)
+
+def test_cached_round_trips_values_and_types(tmp_path):
+    data = tmp_path / "data.csv"
+    data.write_text("PnL\n1\n")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return VALUE
+
+    first = results.cached("test.value", [str(data)], {"p": 1}, compute, seed=0)
+    second = results.cached("test.value", [str(data)], {"p": 1}, compute, seed=0)
+    assert len(calls) == 1
+    assert_same(first, VALUE)
+    assert_same(second, VALUE)
+
+def test_result_key_depends_on_version_and_inputs(tmp_path, monkeypatch):
+    data = tmp_path / "data.csv"
+    data.write_text("PnL\n1\n")
+    key = results.result_key("test.value", [str(data)], {"p": 1}, 0)
+    assert key != results.result_key("test.value", [str(data)], {"p": 2}, 0)
+    assert key != results.result_key("test.value", [str(data)], {"p": 1}, 1)
+    monkeypatch.setattr(results, "CACHE_VERSION", results.CACHE_VERSION + 1)
+    assert key != results.result_key("test.value", [str(data)], {"p": 1}, 0)
+    data.write_text("PnL\n2\n")
+    monkeypatch.undo()
+    assert key != results.result_key("test.value", [str(data)], {"p": 1}, 0)
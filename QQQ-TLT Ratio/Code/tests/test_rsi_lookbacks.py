@@ -0,0 +1,26 @@
+import os
+
+import numpy as np
+import pytest
+
+from ratio.prices import price_store
+from ratio.signals import crossings, rsi, rsi_lookbacks
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+PERIODS = np.arange(1, 251)
+
+@pytest.mark.parametrize("ticker", ["QQQ", "SPY"])
+def test_rsi_lookbacks_matches_rsi_at_every_threshold(ticker):
+    ratio = price_store(DATA).pair(ticker, "TLT").ratio
+    values = rsi_lookbacks(ratio, PERIODS)
+    expected = np.array([rsi(ratio, period) for period in PERIODS])
+
+    np.testing.assert_array_equal(np.isnan(values), np.isnan(expected))
+    np.testing.assert_allclose(values, expected, rtol=0, atol=1e-12)
+    # Both sides of every integer threshold, ties included (SPY, period 4,
+    # bar 1066 is exactly 50)
+    for threshold in range(101):
+        for got, want in zip(crossings(values, threshold, threshold), crossings(expected, threshold, threshold)):
+            np.testing.assert_array_equal(got, want)
+        np.testing.assert_array_equal(values == threshold, expected == threshold)
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+import pytest
+
+from ratio.frame import create_df
+from ratio.prices import price_store
+from ratio.signals import rsi, rsi_signal, scan
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+# (50, 50) and (60, 40) overlap, lower >= upper
+THRESHOLDS = [(15, 70), (30, 70), (24, 65), (50, 50), (60, 40)]
+
+def loop_signal(rsi_values, lower_threshold, upper_threshold):
+    # The original create_df state machine, kept as the reference. It reads
+    # a list instead of df.loc, with the same comparisons, to keep the
+    # test fast.
+    rsi_values = list(rsi_values)
+    signal = [0] * len(rsi_values)
+    signal_active = False
+    for i in range(1, len(rsi_values)):
+        if not signal_active and rsi_values[i - 1] > lower_threshold and rsi_values[i] <= lower_threshold:
+            signal_active = True
+        elif signal_active and rsi_values[i - 1] < upper_threshold and rsi_values[i] >= upper_threshold:
+            signal_active = False
+        signal[i] = int(signal_active)
+    return np.array(signal)
+
+@pytest.mark.parametrize("ticker", ["QQQ", "SPY"])
+@pytest.mark.parametrize("period", [2, 3, 14])
+def test_rsi_signal_matches_loop(ticker, period):
+    prices = price_store(DATA).pair(ticker, "TLT")
+    rsi_values = rsi(prices.ratio, period)
+    for lower_threshold, upper_threshold in THRESHOLDS:
+        expected = loop_signal(rsi_values, lower_threshold, upper_threshold)
+        np.testing.assert_array_equal(rsi_signal(rsi_values, lower_threshold, upper_threshold), expected)
+
+@pytest.mark.parametrize("ticker", ["QQQ", "SPY"])
+@pytest.mark.parametrize("lower_threshold, upper_threshold", THRESHOLDS)
+def test_create_df_signal_matches_loop(ticker, lower_threshold, upper_threshold):
+    df = create_df(ticker, DATA, 3, lower_threshold, upper_threshold)
+    expected = loop_signal(df["RSI"].to_numpy(), lower_threshold, upper_threshold)
+    np.testing.assert_array_equal(df["Signal"].to_numpy(), expected)
+
+def test_scan_matches_loop_on_simultaneous_events():
+    # RSI crossings never enter and exit on the same bar, so the scan
+    # fallback is checked on random events that do
+    rng = np.random.default_rng(0)
+    enters = rng.random((4, 500)) < 0.2
+    exits = rng.random((4, 500)) < 0.2
+    assert np.any(enters & exits)
+    for row in range(len(enters)):
+        active = False
+        expected = []
+        for enter, exit in zip(enters[row], exits[row]):
+            if not active and enter:
+                active = True
+            elif active and exit:
+                active = False
+            expected.append(active)
+        np.testing.assert_array_equal(scan(enters[row], exits[row]), expected)
@@ -0,0 +1,45 @@
+import os
+
+import numpy as np
+import pytest
+
+from ratio.frame import create_df, num_trades, sharpe_ratio
+from ratio.stats import masked_sharpe, masked_stats
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+PARAMS = [(3, 15, 70), (3, 30, 70), (14, 30, 70), (2, 24, 65), (5, 50, 50)]
+
+def pandas_stats(df, ticker):
+    # The statistics computed directly on create_df's columns. Sortino uses
+    # the std of the negative returns, as the Monte Carlo scripts do.
+    ret = df["Ret"].iloc[1:]
+    held = (df["Signal"].shift(1) == 1).iloc[1:]
+    return {
+        "Sharpe Ratio": sharpe_ratio(df["Ret"]),
+        "Sortino Ratio": np.sqrt(252) * ret.mean() / ret[ret < 0].std(ddof=0),
+        "Hit Rate": (ret[held] > 0).mean(),
+        "Exposure": held.mean(),
+        "Trades": num_trades(df),
+        "Cumul Ret": df["Cumul Ret"].iloc[-1],
+    }
+
+@pytest.mark.parametrize("ticker", ["QQQ", "SPY"])
+def test_masked_stats_matches_pandas(ticker):
+    frames = [create_df(ticker, DATA, *params) for params in PARAMS]
+    returns = frames[0][f"{ticker} Ret"].to_numpy()
+    signals = np.stack([df["Signal"].to_numpy() for df in frames])
+
+    batch = masked_stats(signals, returns)
+    for row, df in enumerate(frames):
+        expected = pandas_stats(df, ticker)
+        single = masked_stats(df["Signal"].to_numpy(), returns)
+        for name, value in expected.items():
+            np.testing.assert_allclose(batch[name][row], value, rtol=1e-12, err_msg=name)
+            np.testing.assert_allclose(single[name], value, rtol=1e-12, err_msg=name)
+        np.testing.assert_allclose(masked_sharpe(df["Signal"].to_numpy(), returns), expected["Sharpe Ratio"], rtol=1e-12)
+
+def test_masked_sharpe_of_always_held_is_ticker_sharpe():
+    df = create_df("QQQ", DATA, 3, 15, 70)
+    returns = df["QQQ Ret"].to_numpy()
+    np.testing.assert_allclose(masked_sharpe(np.ones_like(returns), returns), sharpe_ratio(df["QQQ Ret"]), rtol=1e-12)
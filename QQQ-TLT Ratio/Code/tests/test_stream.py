@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pytest
+
+from ratio.frame import create_df
+from ratio.prices import price_store
+from ratio.stream import RatioStream
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+@pytest.mark.parametrize("ticker", ["QQQ", "SPY"])
+@pytest.mark.parametrize("period, lower_threshold, upper_threshold", [(3, 15, 70), (14, 30, 70)])
+def test_stream_matches_create_df(ticker, period, lower_threshold, upper_threshold):
+    df = create_df(ticker, DATA, period, lower_threshold, upper_threshold)
+    prices = price_store(DATA).pair(ticker, "TLT")
+    split = len(df) // 2
+
+    # Bootstrap on a prefix, then stream the rest one bar at a time
+    stream = RatioStream(ticker, period, lower_threshold, upper_threshold)
+    stream.replay(prices.dates[:split], prices.ticker_close[:split], prices.hedge_close[:split])
+    rows = [stream.update(*bar) for bar in zip(prices.dates[split:], prices.ticker_close[split:], prices.hedge_close[split:])]
+
+    expected = df.iloc[split:]
+    np.testing.assert_array_equal([row["Date"] for row in rows], expected["Date"].to_numpy())
+    np.testing.assert_array_equal([row["Signal"] for row in rows], expected["Signal"].to_numpy())
+    for column in ["ratio", "RSI", f"{ticker} Ret", f"Cumul {ticker} Ret", "Ret", "Cumul Ret"]:
+        np.testing.assert_array_equal([row[column] for row in rows], expected[column].to_numpy(), err_msg=column)
+
+def test_stream_rejects_repeated_and_out_of_order_bars():
+    prices = price_store(DATA).pair("QQQ", "TLT")
+    stream = RatioStream("QQQ", 3, 15, 70)
+    stream.replay(prices.dates[:10], prices.ticker_close[:10], prices.hedge_close[:10])
+    with pytest.raises(ValueError):
+        stream.update(prices.dates[9], prices.ticker_close[9], prices.hedge_close[9])
+    with pytest.raises(ValueError):
+        stream.update(prices.dates[5], prices.ticker_close[10], prices.hedge_close[10])
+    stream.update(prices.dates[10], prices.ticker_close[10], prices.hedge_close[10])
@@ -0,0 +1,54 @@
+import os
+import shutil
+
+import pandas as pd
+
+from ratio.sweep import lookback_sharpes, sharpe_matrix
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+LOWERS = range(10, 16)
+UPPERS = range(65, 71)
+
+def copy_data(folder):
+    os.makedirs(folder)
+    for name in ("QQQ.csv", "TLT.csv"):
+        shutil.copy(os.path.join(DATA, name), os.path.join(folder, name))
+    return str(folder)
+
+def edit_closes(csv_path):
+    # Swaps the Adj Close of two bars of the same text length in the second
+    # half of the file, keeping the file's size, and restores its mtime, so
+    # only its contents tell the edit apart
+    stat = os.stat(csv_path)
+    with open(csv_path, newline="") as f:
+        lines = f.readlines()
+    ending = lines[0][len(lines[0].rstrip("\r\n")):]
+    column = lines[0].rstrip("\r\n").split(",").index("Adj Close")
+    rows = [line.rstrip("\r\n").split(",") for line in lines[1:]]
+    i = len(rows) // 2
+    j = next(j for j in range(i + 50, len(rows)) if len(rows[j][column]) == len(rows[i][column]) and rows[j][column] != rows[i][column])
+    rows[i][column], rows[j][column] = rows[j][column], rows[i][column]
+    with open(csv_path, "w", newline="") as f:
+        f.write(lines[0] + "".join(",".join(row) + ending for row in rows))
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(csv_path).st_size == stat.st_size
+
+def test_edited_csv_is_not_cached_with_old_prices(tmp_path):
+    folder = copy_data(tmp_path / "Data")
+    before = sharpe_matrix("QQQ", folder, 3, LOWERS, UPPERS)
+    before_lookback = lookback_sharpes("QQQ", folder, 15, 70, 1, 5)
+
+    edit_closes(os.path.join(folder, "QQQ.csv"))
+    # The same edited contents in a folder no store has read yet
+    fresh = copy_data(tmp_path / "Fresh")
+    shutil.copy(os.path.join(folder, "QQQ.csv"), os.path.join(fresh, "QQQ.csv"))
+    expected = sharpe_matrix("QQQ", fresh, 3, LOWERS, UPPERS, use_cache=False)
+    expected_lookback = lookback_sharpes("QQQ", fresh, 15, 70, 1, 5, use_cache=False)
+    assert not before.equals(expected)
+
+    # A miss in the same process, then a hit on what it stored
+    for _ in range(2):
+        pd.testing.assert_frame_equal(sharpe_matrix("QQQ", folder, 3, LOWERS, UPPERS), expected)
+        pd.testing.assert_frame_equal(lookback_sharpes("QQQ", folder, 15, 70, 1, 5), expected_lookback)
+    assert not before_lookback.equals(expected_lookback)
@@ -0,0 +1,18 @@
+import os
+
+import numpy as np
+
+from ratio.universe import universe_summary
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data")
+
+def test_universe_defaults_to_every_ticker_in_the_folder():
+    summary = universe_summary(folder_path=DATA)
+    pairs = list(zip(summary["Ticker"], summary["Hedge"]))
+    tickers = ["QQQ", "SPY", "TLT"]
+    assert pairs == [(ticker, hedge) for ticker in tickers for hedge in tickers if ticker != hedge]
+    assert np.isfinite(summary["Sharpe Ratio"]).all()
+
+def test_universe_keeps_explicit_tickers():
+    summary = universe_summary(["QQQ"], None, DATA)
+    assert list(zip(summary["Ticker"], summary["Hedge"])) == [("QQQ", "SPY"), ("QQQ", "TLT")]
@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+# Headless timings of the backtest and sizing hot paths on the bundled data.
+# Each run is appended to a JSON history and compared against a stored
+# baseline; a case that got slower by more than --tolerance is flagged.
+#   python benchmarks/run.py [--quick] [--save-baseline]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RATIO_CODE = os.path.join(ROOT, "QQQ-TLT Ratio", "Code")
+RATIO_DATA = os.path.join(ROOT, "QQQ-TLT Ratio", "Data")
+SIZING_CODE = os.path.join(ROOT, "Optimal Sizing", "Codes")
+TRADES = os.path.join(SIZING_CODE, "Trades.csv")
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+sys.path[:0] = [RATIO_CODE, SIZING_CODE]
+
+def price_folder(rows, workdir):
+    # The first `rows` bars of every bundled CSV, or the bundled folder itself
+    if rows is None:
+        return RATIO_DATA
+    folder = os.path.join(workdir, f"rows_{rows}")
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+        for name in os.listdir(RATIO_DATA):
+            if name.endswith(".csv"):
+                pd.read_csv(os.path.join(RATIO_DATA, name), nrows=rows).to_csv(os.path.join(folder, name), index=False)
+    return folder
+
+def n_bars(folder):
+    return len(pd.read_csv(os.path.join(folder, "QQQ.csv"), usecols=["Date"]))
+
+def create_df_case(size, workdir):
+    # Cold: price_store is cleared on every run, so the CSV/column-cache read
+    # and the merge are timed as well, as when create_df read the CSVs itself
+    from ratio.frame import create_df
+    from ratio.prices import price_store
+    folder = price_folder(size, workdir)
+
+    def run():
+        price_store.cache_clear()
+        return create_df("QQQ", folder, 3, 15, 70)
+    return run, n_bars(folder), "bars/s"
+
+def create_df_warm_case(size, workdir):
+    # Warm: prices come from the memoized price_store after the first run
+    from ratio.frame import create_df
+    folder = price_folder(size, workdir)
+    return lambda: create_df("QQQ", folder, 3, 15, 70), n_bars(folder), "bars/s"
+
+def sharpe_grid_case(size, workdir):
+    from ratio.sweep import sharpe_matrix
+    n_lower, n_upper = size
+    lowers, uppers = range(5, 5 + n_lower), range(55, 55 + n_upper)
+    return lambda: sharpe_matrix("QQQ", RATIO_DATA, 3, lowers, uppers, use_cache=False), n_bars(RATIO_DATA) * n_lower * n_upper, "bars/s"
+
+def lookback_case(size, workdir):
+    from ratio.sweep import lookback_sharpes
+    return lambda: lookback_sharpes("QQQ", RATIO_DATA, 15, 70, 1, size, use_cache=False), n_bars(RATIO_DATA) * size, "bars/s"
+
+def combination_case(size, workdir):
+    from sizing.paths import resample_paths
+    pnl = pd.read_csv(TRADES)["PnL"].to_numpy()
+    fractions = np.linspace(0.01, 2.5, 100) * np.mean(pnl) / np.var(pnl)
+    return lambda: resample_paths(pnl, fractions, size, 150, 0.25, seed=0), size * len(fractions), "paths/s"
+
+def bootstrap_case(size, workdir):
+    from sizing.bootstrap import bootstrap
+    pnl = pd.read_csv(TRADES)["PnL"].to_numpy()
+    return lambda: bootstrap(pnl, size, seed=0), size, "paths/s"
+
+def kelly_case(size, workdir):
+    from sizing.kelly import growth_optimal_fraction, terminal_wealth, win_loss_payoffs
+    pnl = pd.read_csv(TRADES)["PnL"].to_numpy()
+    wl_ratio = np.mean(pnl[pnl > 0]) / np.abs(np.mean(pnl[pnl < 0]))
+    payoffs = win_loss_payoffs(pnl[:59] > 0, wl_ratio)
+    risks = np.linspace(0.01, 1, size)
+
+    def run():
+        return growth_optimal_fraction(payoffs), terminal_wealth(payoffs, risks)
+    return run, size, "risks/s"
+
+# name -> (setup, sizes, quick sizes). Setup returns (callable, work units,
+# throughput unit). Every case calls the library function its script
+# delegates to (Plots.create_df, LB_Opt, Combination.simulate,
+# Randomize.run_sims, K1.kelly).
+CASES = {
+    "create_df": (create_df_case, [1000, 4000, None], [1000]),
+    "create_df.warm": (create_df_warm_case, [1000, 4000, None], [1000]),
+    "calculateSharpes": (sharpe_grid_case, [(10, 10), (46, 41)], [(10, 10)]),
+    "LB_Opt": (lookback_case, [20, 250], [20]),
+    "Combination.simulate": (combination_case, [1000, 10000, 100000], [1000]),
+    "Randomize.run_sims": (bootstrap_case, [1000, 10000, 100000], [1000]),
+    "K1.kelly": (kelly_case, [100, 10000], [100]),
+}
+
+def size_label(size):
+    if size is None:
+        return "full"
+    if isinstance(size, tuple):
+        return "x".join(str(s) for s in size)
+    return str(size)
+
+def measure(run, repeat):
+    # One traced warm-up run for peak memory (and any cache building), then
+    # the best of `repeat` untraced runs for wall time.
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times), peak
+
+def run_cases(names, quick=False, repeat=3):
+    results = []
+    workdir = tempfile.mkdtemp(prefix="omega_bench_")
+    try:
+        for name in names:
+            setup, sizes, quick_sizes = CASES[name]
+            for size in (quick_sizes if quick else sizes):
+                row = {"case": name, "size": size_label(size)}
+                try:
+                    run, units, unit = setup(size, workdir)
+                except ImportError as e:
+                    row["skipped"] = str(e)
+                    results.append(row)
+                    continue
+                seconds, peak = measure(run, repeat)
+                row.update({
+                    "seconds": seconds,
+                    "peak_mb": peak / 2**20,
+                    "throughput": units / seconds,
+                    "unit": unit,
+                })
+                results.append(row)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_record(results):
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+def read_json(path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+def write_json(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, path)
+
+def flag_regressions(results, baseline, tolerance=0.2):
+    # Adds "baseline_seconds", "ratio" and "regression" to every result that
+    # has a timed baseline counterpart.
+    reference = {(r["case"], r["size"]): r for r in (baseline or {}).get("results", []) if "seconds" in r}
+    for row in results:
+        base = reference.get((row["case"], row["size"]))
+        if base is None or "seconds" not in row:
+            continue
+        row["baseline_seconds"] = base["seconds"]
+        row["ratio"] = row["seconds"] / base["seconds"]
+        row["regression"] = row["ratio"] > 1 + tolerance
+    return [row for row in results if row.get("regression")]
+
+def print_results(results):
+    table = pd.DataFrame(results)
+    print(table.to_string(index=False))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the backtest and sizing hot paths.")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--quick", action="store_true", help="smallest size of each case only")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--history", default=os.path.join(HERE, "history.json"))
+    parser.add_argument("--baseline", default=os.path.join(HERE, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    record = run_record(run_cases(args.cases, args.quick, args.repeat))
+    regressions = flag_regressions(record["results"], read_json(args.baseline, None), args.tolerance)
+
+    history = read_json(args.history, [])
+    history.append(record)
+    write_json(args.history, history)
+    if args.save_baseline:
+        write_json(args.baseline, record)
+
+    print_results(record["results"])
+    for row in regressions:
+        print(f"REGRESSION {row['case']} [{row['size']}]: {row['seconds']:.4f}s vs {row['baseline_seconds']:.4f}s baseline")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import importlib
+import json
+import os
+
+# Shared by the python -m ratio and python -m sizing entry points. A command
+# takes the parsed args and returns (result, figures), where figures is a
+# list of (name, build) and build(plots) returns a matplotlib figure. Only
+# the standard library is imported here so that parsing stays fast;
+# matplotlib and the package's plots module load only with --figures.
+
+def add_output_args(parser):
+    parser.add_argument("--workers", type=int, default=1, help="0 uses every core")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="recompute instead of reading the result cache")
+    parser.add_argument("--out-dir", default=".")
+    parser.add_argument("--figures", action="store_true", help="also write PNG figures")
+
+def save_figures(out_dir, figures, plots_module):
+    import matplotlib
+    matplotlib.use("Agg")
+    plots = importlib.import_module(plots_module)
+
+    paths = []
+    for name, build in figures:
+        path = os.path.join(out_dir, f"{name}.png")
+        fig = build(plots)
+        fig.savefig(path, bbox_inches="tight")
+        plots.pyplot().close(fig)
+        paths.append(path)
+    return paths
+
+def run(commands, args, plots_module):
+    # Writes <out-dir>/<command>.json and prints its path
+    args.workers = args.workers or None
+    result, figures = commands[args.command](args)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    result = {"command": args.command, "params": {k: v for k, v in vars(args).items() if k not in ("command", "out_dir", "figures")}, **result}
+    if args.figures:
+        result["figures"] = save_figures(args.out_dir, figures, plots_module)
+    json_path = os.path.join(args.out_dir, f"{args.command}.json")
+    with open(json_path, "w") as f:
+        json.dump(result, f, indent=1)
+    print(json_path)
+    return 0
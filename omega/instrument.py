@@ -0,0 +1,133 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Opt-in per-stage instrumentation. Code marks its stages with
+#     with stage("create_df.rsi"):
+#         ...
+# which is a shared no-op unless instrumentation is on, either for a block
+#     with instrument():
+#         ...
+# or for the whole process with OMEGA_INSTRUMENT=1 (OMEGA_INSTRUMENT=time
+# skips memory tracing). Each stage aggregates calls, cumulative seconds and
+# bytes allocated (tracemalloc peak above the stage's starting level).
+# With the environment variable set, the summary is printed to stderr at
+# exit and OMEGA_INSTRUMENT_TRACE=<path> also writes a Chrome trace.
+# Stages that run inside process-pool workers are not collected. ratio and
+# sizing both import this one module, so a process has a single state, a
+# single exit report and a single trace across the two packages.
+
+_state = {"enabled": False, "memory": False, "stats": {}, "events": [], "stack": [], "origin": time.perf_counter()}
+
+class _NoStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_STAGE = _NoStage()
+
+class _Stage:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if _state["memory"]:
+            self.base = tracemalloc.get_traced_memory()[0]
+            self.peak = self.base
+            tracemalloc.reset_peak()
+        _state["stack"].append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        _state["stack"].pop()
+        allocated = 0
+        if _state["memory"]:
+            # Inner stages reset the tracemalloc peak, so they hand theirs up
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            allocated = self.peak - self.base
+            if _state["stack"]:
+                parent = _state["stack"][-1]
+                parent.peak = max(parent.peak, self.peak)
+
+        stats = _state["stats"].setdefault(self.name, [0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] += allocated
+        _state["events"].append((self.name, self.start, seconds, allocated, threading.get_ident()))
+        return False
+
+def stage(name):
+    return _Stage(name) if _state["enabled"] else _NO_STAGE
+
+def enable(memory=True):
+    _state["enabled"] = True
+    _state["memory"] = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable():
+    _state["enabled"] = False
+    _state["memory"] = False
+
+def reset():
+    _state["stats"].clear()
+    _state["events"].clear()
+
+@contextmanager
+def instrument(memory=True):
+    was_enabled, had_memory = _state["enabled"], _state["memory"]
+    started_tracing = memory and not tracemalloc.is_tracing()
+    enable(memory)
+    try:
+        yield
+    finally:
+        _state["enabled"], _state["memory"] = was_enabled, had_memory
+        if started_tracing:
+            tracemalloc.stop()
+
+def summary():
+    import pandas as pd
+    rows = [
+        {"Stage": name, "Calls": calls, "Seconds": seconds, "Mean ms": 1000 * seconds / calls, "MB Allocated": allocated / 2**20}
+        for name, (calls, seconds, allocated) in _state["stats"].items()
+    ]
+    columns = ["Stage", "Calls", "Seconds", "Mean ms", "MB Allocated"]
+    return pd.DataFrame(rows, columns=columns).sort_values("Seconds", ascending=False, ignore_index=True)
+
+def chrome_trace():
+    return {"traceEvents": [
+        {
+            "name": name,
+            "ph": "X",
+            "ts": 1e6 * (start - _state["origin"]),
+            "dur": 1e6 * seconds,
+            "pid": os.getpid(),
+            "tid": thread,
+            "args": {"bytes": allocated},
+        }
+        for name, start, seconds, allocated, thread in _state["events"]
+    ]}
+
+def write_chrome_trace(path):
+    with open(path, "w") as f:
+        json.dump(chrome_trace(), f)
+
+def _report():
+    if _state["stats"]:
+        print(summary().to_string(index=False), file=sys.stderr)
+    trace_path = os.environ.get("OMEGA_INSTRUMENT_TRACE")
+    if trace_path:
+        write_chrome_trace(trace_path)
+
+if os.environ.get("OMEGA_INSTRUMENT", "") not in ("", "0"):
+    enable(memory=os.environ["OMEGA_INSTRUMENT"] != "time")
+    atexit.register(_report)
@@ -0,0 +1,154 @@
+import hashlib
+import importlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from omega.instrument import stage
+
+# Persistent cache for sweep and simulation results. An entry's key hashes
+# the contents of its input files, the function name, its parameters and
+# the RNG seed, so editing a data file invalidates everything computed from
+# it. Entries are .npz files in a .result_cache folder next to the first
+# input file, holding the result's arrays plus a JSON layout to rebuild it
+# (arrays, DataFrames, namedtuples, tuples, lists, dicts, NumPy scalars and
+# JSON scalars). CACHE_VERSION is part of every key; bump it when the entry
+# format or a cached function's output changes so old entries are missed.
+# Hits refresh the file's mtime; once the folder grows past max_bytes the
+# least recently used entries are deleted. OMEGA_RESULT_CACHE_MB sets the
+# default cap and OMEGA_RESULT_CACHE=0 turns the cache off.
+
+CACHE_DIR = ".result_cache"
+CACHE_VERSION = 2
+MAX_BYTES = int(float(os.environ.get("OMEGA_RESULT_CACHE_MB", 256)) * 2**20)
+
+def enabled():
+    return os.environ.get("OMEGA_RESULT_CACHE", "") != "0"
+
+def file_digest(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def result_key(name, files, params, seed=None):
+    payload = {
+        "version": CACHE_VERSION,
+        "name": name,
+        "files": [file_digest(path) for path in files],
+        "params": params,
+        "seed": seed,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+def cache_dir(files):
+    return os.path.join(os.path.dirname(files[0]), CACHE_DIR)
+
+def _pack(value, arrays):
+    if isinstance(value, np.ndarray):
+        key = f"a{len(arrays)}"
+        arrays[key] = value
+        return {"t": "array", "k": key}
+    if isinstance(value, pd.DataFrame):
+        return {
+            "t": "frame",
+            "columns": _pack(list(value.columns), arrays),
+            "index": _pack(value.index.to_numpy(), arrays),
+            "data": [_pack(value[column].to_numpy(), arrays) for column in value.columns],
+        }
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        cls = type(value)
+        return {"t": "namedtuple", "cls": f"{cls.__module__}:{cls.__qualname__}", "items": [_pack(v, arrays) for v in value]}
+    if isinstance(value, (tuple, list)):
+        return {"t": type(value).__name__, "items": [_pack(v, arrays) for v in value]}
+    if isinstance(value, dict):
+        return {"t": "dict", "keys": list(value), "items": [_pack(v, arrays) for v in value.values()]}
+    if isinstance(value, np.generic):
+        # A 0-d array keeps the exact dtype, np.float64 stays np.float64
+        key = f"a{len(arrays)}"
+        arrays[key] = np.asarray(value)
+        return {"t": "scalar", "k": key}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"t": "value", "v": value}
+    raise TypeError(f"Cannot cache a {type(value).__name__}.")
+
+def _unpack(layout, arrays):
+    kind = layout["t"]
+    if kind == "array":
+        return arrays[layout["k"]]
+    if kind == "scalar":
+        return arrays[layout["k"]][()]
+    if kind == "frame":
+        columns = _unpack(layout["columns"], arrays)
+        data = {column: _unpack(item, arrays) for column, item in zip(columns, layout["data"])}
+        return pd.DataFrame(data, index=_unpack(layout["index"], arrays), columns=columns)
+    if kind == "namedtuple":
+        module, name = layout["cls"].split(":")
+        cls = getattr(importlib.import_module(module), name)
+        return cls(*(_unpack(item, arrays) for item in layout["items"]))
+    if kind in ("tuple", "list"):
+        items = [_unpack(item, arrays) for item in layout["items"]]
+        return tuple(items) if kind == "tuple" else items
+    if kind == "dict":
+        return {key: _unpack(item, arrays) for key, item in zip(layout["keys"], layout["items"])}
+    return layout["v"]
+
+def load(path):
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    return _unpack(json.loads(str(arrays.pop("layout"))), arrays)
+
+def store(path, value):
+    arrays = {}
+    layout = _pack(value, arrays)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, layout=np.array(json.dumps(layout)), **arrays)
+    os.replace(tmp_path, path)
+
+def evict(directory, max_bytes=MAX_BYTES):
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(".npz"):
+            stat = os.stat(os.path.join(directory, name))
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(os.path.join(directory, name))
+        total -= size
+
+def cached(name, files, params, compute, seed=None, max_bytes=MAX_BYTES):
+    # compute() on a miss, the stored result on a hit. A cache that cannot
+    # be read or written falls back to computing.
+    if not enabled():
+        return compute()
+    directory = cache_dir(files)
+    key = result_key(name, files, params, seed)
+    path = os.path.join(directory, f"{key}.npz")
+    if os.path.exists(path):
+        try:
+            with stage("results.load"):
+                value = load(path)
+            os.utime(path)
+            return value
+        except (OSError, ValueError, KeyError):
+            pass
+
+    value = compute()
+    # A file edited while compute() ran may not match the key; such a
+    # result is returned but not stored.
+    if result_key(name, files, params, seed) != key:
+        return value
+    try:
+        with stage("results.store"):
+            os.makedirs(directory, exist_ok=True)
+            store(path, value)
+            evict(directory, max_bytes)
+    except OSError:
+        pass
+    return value